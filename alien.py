@@ -1,34 +0,0 @@
-import pygame
-from pygame.sprite import AbstractGroup, Sprite
-
-class Alien(Sprite):
-    """A class to represent a single alien"""
-
-    def __init__(self, ai_game) -> None:
-        """Initialize alien and set starting position"""
-        super().__init__()
-        self.screen = ai_game.screen
-        self.settings = ai_game.settings
-
-        #Load the alien image and set its rect
-        self.image = pygame.image.load("alien.bmp")
-        self.rect = self.image.get_rect()
-
-        #Start each new alien near top left of screen
-        self.rect.x = self.rect.width
-        self.rect.y = self.rect.height
-
-        #Store the alien's exact horizontal position
-        self.x = float(self.rect.x)
-
-
-    def check_edges(self):
-        """Return True of allien at edge of screen"""
-        screen_rect = self.screen.get_rect()
-        return (self.rect.right >= screen_rect.right) or (self.rect.left <= 0)
-    
-
-    def update(self):
-        """Move the alien to the right or left"""
-        self.x += self.settings.alien_speed * self.settings.fleet_direction
-        self.rect.x = self.x
\ No newline at end of file
@@ -0,0 +1,37 @@
+from pathlib import Path
+import pygame
+
+
+#Relative image paths are looked up from the engine folder, wherever it runs from
+ROOT = Path(__file__).resolve().parent
+
+
+class AssetRegistry:
+    """A class to load game images once and share them between sprites"""
+
+    def __init__(self) -> None:
+        """Initialize an empty image cache"""
+        self._images = {}
+
+
+    def image(self, path, alpha=False):
+        """Return the shared Surface for path, loading it on first use"""
+        path = ROOT / path
+        key = (str(path), alpha)
+        surface = self._images.get(key)
+        if surface is None:
+            surface = pygame.image.load(path)
+            #Match the display pixel format so blits skip conversion
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha() if alpha else surface.convert()
+            self._images[key] = surface
+        return surface
+
+
+#One registry for the whole process so every sprite shares the same Surfaces
+registry = AssetRegistry()
+
+
+def load_image(path, alpha=False):
+    """Return the shared Surface for an image file"""
+    return registry.image(path, alpha)
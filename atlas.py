@@ -0,0 +1,65 @@
+import pygame
+
+
+class Atlas:
+    """A class to pack every sprite image into one surface
+
+    Images are added by name, then packed side by side into rows no wider
+    than max_width.  Each layer of sprites is then drawn with one blits()
+    call that copies the same area of the atlas to many places.
+    """
+
+    def __init__(self, max_width=1024, padding=1) -> None:
+        """Start an empty atlas"""
+        self.max_width = max_width
+        self.padding = padding
+        self.images = {}
+        #Where each image ended up in the atlas surface
+        self.areas = {}
+        self.surface = None
+
+
+    def add(self, name, image):
+        """Add an image to be packed"""
+        self.images[name] = image
+
+
+    def add_shape(self, name, size, color):
+        """Add a solid rectangle, such as a bullet"""
+        shape = pygame.Surface(size)
+        shape.fill(color)
+        self.add(name, shape)
+
+
+    def pack(self):
+        """Lay the images out in rows, tallest first, and copy them into the atlas"""
+        areas = {}
+        x = y = row_height = width = 0
+        for name, image in sorted(self.images.items(), key=lambda item: -item[1].get_height()):
+            image_width, image_height = image.get_size()
+            if x and x + image_width > self.max_width:
+                #Start a new row under the tallest image of this one
+                x, y, row_height = 0, y + row_height + self.padding, 0
+            areas[name] = pygame.Rect(x, y, image_width, image_height)
+            x += image_width + self.padding
+            row_height = max(row_height, image_height)
+            width = max(width, x)
+        #Keep transparency if any image has it, otherwise copy as fast as possible
+        alpha = any(image.get_flags() & pygame.SRCALPHA or image.get_colorkey() is not None
+            for image in self.images.values())
+        surface = pygame.Surface((max(width, 1), max(y + row_height, 1)),
+            pygame.SRCALPHA if alpha else 0)
+        for name, area in areas.items():
+            surface.blit(self.images[name], area)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha() if alpha else surface.convert()
+        self.surface = surface
+        self.areas = areas
+        return surface
+
+
+    def layer(self, name, positions):
+        """Return the blits() sequence that draws image name at each position"""
+        surface = self.surface
+        area = self.areas[name]
+        return [(surface, position, area) for position in positions]
@@ -0,0 +1,154 @@
+import sys
+from pathlib import Path
+import pygame
+
+
+class SoundEngine:
+    """A class to play game sounds through a fixed pool of mixer channels
+
+    Effects are registered by name with a category. Each sound file is
+    decoded the first time it plays, each category owns its own channels,
+    and an effect that already played this frame is not played again.
+    """
+
+    def __init__(self, base_dir, categories=None, min_gap_frames=1) -> None:
+        """Initialize the engine; the mixer starts on first use"""
+        self.base_dir = Path(base_dir)
+        #Channels reserved for each category of effect
+        self.categories = categories or {"shot": 2, "explosion": 4}
+        self.min_gap_frames = min_gap_frames
+        self.paths = {}
+        self.sound_categories = {}
+        self.sounds = {}
+        self.last_played = {}
+        self.frame = 0
+        self.channels = None
+        self.enabled = True
+
+
+    def register(self, name, path, category):
+        """Add an effect, with path relative to the engine's folder
+
+        Effects with a missing file or an unknown category stay silent.
+        """
+        path = self.base_dir / path
+        if not path.exists():
+            print(f"Sound {name!r} is silent: no file {path}", file=sys.stderr)
+            return
+        if category not in self.categories:
+            print(f"Sound {name!r} is silent: no category {category!r}", file=sys.stderr)
+            return
+        self.paths[name] = path
+        self.sound_categories[name] = category
+
+
+    def _start_mixer(self):
+        """Start the mixer and hand out each category's channels"""
+        try:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
+        except pygame.error:
+            #No audio device: carry on silently
+            self.enabled = False
+            return
+        total = sum(self.categories.values())
+        pygame.mixer.set_num_channels(max(total, pygame.mixer.get_num_channels()))
+        #Reserved channels are never picked by Sound.play(), only by us
+        pygame.mixer.set_reserved(total)
+        self.channels = {}
+        first = 0
+        for category, count in self.categories.items():
+            self.channels[category] = [pygame.mixer.Channel(number)
+                for number in range(first, first + count)]
+            first += count
+
+
+    def _sound(self, name):
+        """Return the decoded sound for name, decoding it on first use
+
+        A file that won't decode makes the effect silent and returns None.
+        """
+        sound = self.sounds.get(name)
+        if sound is None:
+            try:
+                sound = pygame.mixer.Sound(str(self.paths[name]))
+            except pygame.error as error:
+                print(f"Sound {name!r} is silent: {error}", file=sys.stderr)
+                del self.sound_categories[name]
+                return None
+            self.sounds[name] = sound
+        return sound
+
+
+    def preload(self, name):
+        """Decode an effect ahead of its first use"""
+        if self.channels is None:
+            self._start_mixer()
+        if self.enabled and name in self.sound_categories:
+            self._sound(name)
+
+
+    def new_frame(self):
+        """Start a new simulation frame for rate limiting"""
+        self.frame += 1
+
+
+    def play(self, name):
+        """Play an effect unless it played too recently or has no sound file"""
+        if not self.enabled or name not in self.sound_categories:
+            return
+        last = self.last_played.get(name)
+        if last is not None and self.frame - last < self.min_gap_frames:
+            return
+        self.last_played[name] = self.frame
+        if self.channels is None:
+            self._start_mixer()
+            if not self.enabled:
+                return
+        sound = self._sound(name)
+        if sound is None:
+            return
+        channels = self.channels[self.sound_categories[name]]
+        #Use a free channel, or cut off the first one in the category
+        channel = next((channel for channel in channels if not channel.get_busy()), channels[0])
+        channel.play(sound)
+
+
+    def play_music(self, path, loops=-1):
+        """Stream background music, skipping it if the file is missing"""
+        path = self.base_dir / path
+        if not self.enabled or not path.exists():
+            return
+        if self.channels is None:
+            self._start_mixer()
+            if not self.enabled:
+                return
+        try:
+            pygame.mixer.music.load(str(path))
+        except pygame.error as error:
+            print(f"Music is silent: {error}", file=sys.stderr)
+            return
+        pygame.mixer.music.play(loops)
+
+
+class NullSoundEngine:
+    """A sound engine that plays nothing, for headless runs"""
+
+    def register(self, name, path, category):
+        """Ignore the effect"""
+
+
+    def preload(self, name):
+        """Nothing to decode"""
+
+
+    def new_frame(self):
+        """Nothing to rate limit"""
+
+
+    def play(self, name):
+        """Play nothing"""
+
+
+    def play_music(self, path, loops=-1):
+        """Play nothing"""
@@ -0,0 +1,13 @@
+from pygame.sprite import Sprite
+from assets import load_image
+
+
+class Background(Sprite):
+    """A class to draw an image behind the game"""
+
+    def __init__(self, ai_game):
+        """Load the background image set for this game"""
+        super().__init__()
+        self.image = load_image(ai_game.settings.background_image)
+        self.rect = self.image.get_rect()
+        self.rect.left, self.rect.top = 0,0
\ No newline at end of file
@@ -0,0 +1,104 @@
+"""Evaluate bots against headless Alien Invasion games in parallel.
+
+    python batch.py --preset space --policy tracker --episodes 32 --workers 4
+"""
+import argparse
+import multiprocessing
+import random
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+from presets import PRESETS
+
+
+def idle(controller, rng):
+    """Do nothing"""
+
+
+def random_policy(controller, rng):
+    """Wander and fire at random"""
+    if rng.random() < 0.05:
+        controller.move(rng.choice((-1, 0, 1)))
+    if rng.random() < 0.2:
+        controller.fire()
+    if rng.random() < 0.01:
+        controller.fire_rocket()
+
+
+def tracker(controller, rng):
+    """Steer under the nearest alien and keep firing"""
+    aliens = controller.ai_game.aliens
+    ship_x = controller.ai_game.ship.rect.centerx
+    if len(aliens):
+        centers = aliens.x[aliens.alive] + aliens.width / 2
+        target = centers[abs(centers - ship_x).argmin()]
+        controller.move(0 if abs(target - ship_x) < 4 else (1 if target > ship_x else -1))
+    controller.fire()
+    controller.fire_rocket()
+
+
+POLICIES = {"idle": idle, "random": random_policy, "tracker": tracker}
+
+
+def run_episode(preset, policy, seed, max_frames, settings_path=None):
+    """Play one headless episode of a preset and return its results"""
+    from space import AlienInvasion
+    from controller import GameController
+    act = POLICIES[policy]
+    rng = random.Random(seed)
+    start = perf_counter()
+    ai_game = AlienInvasion(headless=True, preset=preset, settings_path=settings_path)
+    controller = GameController(ai_game)
+    controller.start()
+    frames = 0
+    while not controller.game_over and frames < max_frames:
+        act(controller, rng)
+        controller.step()
+        frames += 1
+    return {"preset": preset, "policy": policy, "seed": seed, "score": controller.stats.score,
+        "level": controller.stats.level, "frames": frames, "wall_s": perf_counter() - start}
+
+
+def run_batch(preset, policy, episodes, workers=None, max_frames=36000, first_seed=0,
+        settings_path=None):
+    """Run episodes across a process pool; return the per-episode results and a summary"""
+    start = perf_counter()
+    #Spawned workers start clean, with no display or mixer state to inherit
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = [pool.submit(run_episode, preset, policy, seed, max_frames, settings_path)
+            for seed in range(first_seed, first_seed + episodes)]
+        results = [future.result() for future in futures]
+    wall = perf_counter() - start
+    summary = {"episodes": episodes, "wall_s": wall,
+        "episodes_per_s": episodes / wall,
+        "frames_per_s": sum(result["frames"] for result in results) / wall,
+        "mean_score": statistics.mean(result["score"] for result in results),
+        "mean_level": statistics.mean(result["level"] for result in results),
+        "mean_frames": statistics.mean(result["frames"] for result in results)}
+    return results, summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="space")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="random")
+    parser.add_argument("--episodes", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: CPU count)")
+    parser.add_argument("--max-frames", type=int, default=36000, help="cap per episode (default 10 minutes)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first episode")
+    parser.add_argument("--settings", metavar="FILE", help="JSON or TOML file of setting changes")
+    args = parser.parse_args()
+
+    results, summary = run_batch(args.preset, args.policy, args.episodes, args.workers,
+        args.max_frames, args.seed, args.settings)
+    for result in results:
+        print(f"seed {result['seed']:>4}  score {result['score']:>8,}  level {result['level']:>3}"
+            f"  frames {result['frames']:>7}  {result['wall_s']:.2f} s")
+    print(f"{summary['episodes']} episodes in {summary['wall_s']:.2f} s:"
+        f" {summary['episodes_per_s']:.2f} episodes/s, {summary['frames_per_s']:,.0f} frames/s,"
+        f" mean score {summary['mean_score']:,.0f}, mean level {summary['mean_level']:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Time drawing the same frames with each render backend on this host.
+
+Run from anywhere:
+
+    python benchmarks/backends.py --frames 2000
+    python benchmarks/backends.py --window --preset game
+
+Headless runs use SDL's dummy video driver, so the SDL backend runs on SDL's
+software renderer; --window opens real windows to measure the host's GPU
+renderer, if it has one.  The cheaper backend is printed last and can be set
+as render_backend in a settings file.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import pygame
+from config import load_settings_file
+from presets import PRESETS
+from headless import ScriptedInput
+from space import AlienInvasion
+
+
+BACKENDS = ("software", "sdl2")
+
+
+def measure(backend, preset, frames, window=False, settings_path=None):
+    """Play a scripted game drawn by backend and return its draw timings"""
+    changes = dict(load_settings_file(settings_path)) if settings_path else {}
+    changes["render_backend"] = backend
+    with tempfile.TemporaryDirectory() as folder:
+        path = Path(folder) / "settings.json"
+        path.write_text(json.dumps(changes))
+        ai_game = AlienInvasion(headless=not window, preset=preset, settings_path=path,
+            scores_path=Path(folder) / "scores.json")
+    script = ScriptedInput()
+    script.click(0, ai_game.play_button.rect.center)
+    for frame in range(1, frames, 12):
+        script.tap(frame, pygame.K_SPACE)
+        script.tap(frame, pygame.K_r)
+    draw_ms = []
+    for frame in range(frames):
+        for event in script.events(frame):
+            ai_game._handle_event(event)
+        ai_game.step()
+        start = perf_counter()
+        ai_game._update_screen()
+        draw_ms.append((perf_counter() - start) * 1000)
+    pygame.display.quit()
+    return {"backend": backend, "accelerated": ai_game.backend.accelerated,
+        "draw_ms": statistics.mean(draw_ms),
+        "draw_p99_ms": sorted(draw_ms)[int(0.99 * (frames - 1))]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="space")
+    parser.add_argument("--frames", type=int, default=2000)
+    parser.add_argument("--window", action="store_true",
+        help="draw to real windows instead of SDL's dummy driver")
+    parser.add_argument("--settings", metavar="FILE",
+        help="JSON or TOML file of setting changes to run with")
+    args = parser.parse_args()
+
+    results = []
+    for backend in BACKENDS:
+        result = measure(backend, args.preset, args.frames, args.window, args.settings)
+        kind = "GPU" if result["accelerated"] else "software"
+        print(f"{backend:>8} ({kind}): draw {result['draw_ms']:.3f} ms"
+            f" (p99 {result['draw_p99_ms']:.3f})")
+        results.append(result)
+    cheapest = min(results, key=lambda result: result["draw_ms"])
+    print(f"cheapest: render_backend = \"{cheapest['backend']}\"")
+
+
+if __name__ == "__main__":
+    main()
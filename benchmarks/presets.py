@@ -0,0 +1,90 @@
+"""Time the same scripted game against every preset of the engine.
+
+Run from anywhere:
+
+    python benchmarks/presets.py --frames 3000
+    python benchmarks/presets.py --preset game --no-render
+    python benchmarks/presets.py --settings load_test.json
+
+Every preset plays the same input: Play is clicked, the ship sweeps left and
+right and fires bullets (and rockets, where the preset has them) on a fixed
+beat.  Games run headless, so the numbers are simulation and drawing cost
+with no waiting for the display.
+"""
+import argparse
+import os
+import statistics
+import sys
+from pathlib import Path
+from time import perf_counter
+
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import pygame
+from presets import PRESETS
+from headless import ScriptedInput
+from space import AlienInvasion
+
+
+def session(ai_game, frames, sweep=240, beat=12):
+    """Return the shared input script for a run of frames"""
+    script = ScriptedInput()
+    script.click(0, ai_game.play_button.rect.center)
+    for start in range(1, frames, sweep):
+        key = pygame.K_RIGHT if start // sweep % 2 == 0 else pygame.K_LEFT
+        script.tap(start, key, hold=sweep - 1)
+    for frame in range(1, frames, beat):
+        script.tap(frame, pygame.K_SPACE)
+    for frame in range(1, frames, beat * 10):
+        script.tap(frame, pygame.K_r)
+    return script
+
+
+def measure(preset, frames, render=True, settings_path=None):
+    """Play the session on preset and return its timings"""
+    ai_game = AlienInvasion(headless=True, preset=preset, settings_path=settings_path)
+    script = session(ai_game, frames)
+    step_ms = []
+    draw_ms = []
+    for frame in range(frames):
+        for event in script.events(frame):
+            ai_game._handle_event(event)
+        start = perf_counter()
+        ai_game.step()
+        drawn = perf_counter()
+        if render:
+            ai_game._update_screen()
+        step_ms.append((drawn - start) * 1000)
+        draw_ms.append((perf_counter() - drawn) * 1000)
+    total_s = (sum(step_ms) + sum(draw_ms)) / 1000
+    return {"preset": preset, "frames": frames,
+        "step_ms": statistics.mean(step_ms),
+        "step_p99_ms": sorted(step_ms)[int(0.99 * (frames - 1))],
+        "draw_ms": statistics.mean(draw_ms),
+        "draw_p99_ms": sorted(draw_ms)[int(0.99 * (frames - 1))],
+        "frames_per_s": frames / total_s,
+        "score": ai_game.stats.score}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--preset", choices=sorted(PRESETS), action="append",
+        help="preset to run; repeat for several (default: all)")
+    parser.add_argument("--frames", type=int, default=3000)
+    parser.add_argument("--no-render", dest="render", action="store_false",
+        help="time the simulation only")
+    parser.add_argument("--settings", metavar="FILE",
+        help="JSON or TOML file of setting changes, e.g. more bullets or a bigger fleet")
+    args = parser.parse_args()
+
+    for preset in args.preset or sorted(PRESETS):
+        result = measure(preset, args.frames, args.render, args.settings)
+        print(f"{preset:>8}: step {result['step_ms']:.3f} ms (p99 {result['step_p99_ms']:.3f})"
+            f"  draw {result['draw_ms']:.3f} ms (p99 {result['draw_p99_ms']:.3f})"
+            f"  {result['frames_per_s']:,.0f} frames/s  score {result['score']:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Measure how long Alien Invasion takes to show its first frame.
+
+Run from anywhere:
+
+    python benchmarks/startup.py --preset game --runs 5 --target-ms 800
+
+Each run starts a fresh interpreter, so imports and disk reads are counted.
+SDL's dummy video driver is used unless --window is given. The exit status
+is 1 when the median time to first frame is over the target.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+from presets import PRESETS
+
+CHILD = """
+import time
+start = time.perf_counter()
+import json, sys
+sys.path.insert(0, ".")
+from space import AlienInvasion
+imported = time.perf_counter()
+ai = AlienInvasion(preset={preset!r})
+created = time.perf_counter()
+ai._update_screen()
+shown = time.perf_counter()
+print(json.dumps({{"import_ms": (imported - start) * 1000,
+    "init_ms": (created - imported) * 1000,
+    "draw_ms": (shown - created) * 1000,
+    "first_frame_ms": (shown - start) * 1000}}))
+"""
+
+
+def measure(preset, window=False):
+    """Start a preset once and return its startup timings in ms"""
+    env = dict(os.environ)
+    if not window:
+        env["SDL_VIDEODRIVER"] = "dummy"
+        env["SDL_AUDIODRIVER"] = "dummy"
+    env["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    start = time.perf_counter()
+    output = subprocess.run([sys.executable, "-c", CHILD.format(preset=preset)],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True).stdout
+    #The child exits right after its first frame, so this is close to launch time
+    timings = json.loads(output.strip().splitlines()[-1])
+    timings["process_ms"] = (time.perf_counter() - start) * 1000
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="space")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--target-ms", type=float, default=1000.0,
+        help="fail when the median time to first frame is above this")
+    parser.add_argument("--window", action="store_true", help="open a real window")
+    args = parser.parse_args()
+
+    runs = [measure(args.preset, args.window) for _ in range(args.runs)]
+    medians = {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+    for key, value in medians.items():
+        print(f"{key:>15}: {value:8.1f} ms")
+    passed = medians["first_frame_ms"] <= args.target_ms
+    print(f"time to first frame {'within' if passed else 'OVER'} target of {args.target_ms:.0f} ms")
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,189 @@
+"""Run Alien Invasion through stress scenarios and check for regressions.
+
+Run from anywhere:
+
+    python benchmarks/stress.py
+    python benchmarks/stress.py --scenario bullets_500 --frames 1000
+    python benchmarks/stress.py --save baseline.json
+    python benchmarks/stress.py --compare baseline.json --threshold 15
+
+Each scenario starts a headless game in a fresh interpreter, plays it and
+reports the ms per frame spent in each phase of the loop, the memory
+allocated per frame and the process's peak RSS.  --save writes the results
+as a JSON baseline; --compare runs the scenarios again and exits with status
+1 when frame time, allocations or peak RSS grew past the threshold percent.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+try:
+    import resource
+except ImportError:
+    #Windows has no resource module, so peak RSS is not reported there
+    resource = None
+
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+#Results compared against a baseline; the rest are for reading
+COMPARED = ("frame_ms", "alloc_kb_per_frame", "peak_rss_mb")
+
+
+def _fire_bullets(ai_game, frame):
+    """Fire a bullet every frame"""
+    ai_game._fire_bullet()
+
+
+def _fire_rockets(ai_game, frame):
+    """Fire a rocket every frame"""
+    ai_game._fire_rocket()
+
+
+def _level_up(ai_game, frame):
+    """Clear the fleet every tenth frame so the next tick starts a new level"""
+    if frame % 10 == 0:
+        ai_game.aliens.empty()
+
+
+def _hit_ship(ai_game, frame):
+    """Hit the ship every 40th frame, never letting the game end"""
+    if frame % 40 == 0:
+        ai_game.stats.ships_left = ai_game.settings.ship_limit
+        ai_game._ship_hit()
+
+
+#Scenario name: (preset, setting changes, action run before every tick)
+SCENARIOS = {
+    "fleet_4k": ("space", {"screen_width": 3840, "screen_height": 2160}, None),
+    "bullets_500": ("space", {"bullets_allowed": 500}, _fire_bullets),
+    "rocket_spam": ("game", {"rockets_allowed": 50}, _fire_rockets),
+    "level_ups": ("space", {}, _level_up),
+    "ship_hits": ("space", {}, _hit_ship),
+}
+
+
+def run_scenario(name, frames, alloc_frames):
+    """Play scenario name in this process and return its results"""
+    import pygame
+    from space import AlienInvasion
+    from profiler import FrameProfiler
+    preset, changes, action = SCENARIOS[name]
+    with tempfile.TemporaryDirectory() as folder:
+        path = Path(folder) / "settings.json"
+        path.write_text(json.dumps(changes))
+        ai_game = AlienInvasion(headless=True, preset=preset, settings_path=path)
+    profiler = FrameProfiler(window=frames)
+    profiler.instrument(ai_game)
+    ai_game._start_game()
+
+    def frame(number):
+        if action is not None:
+            action(ai_game, number)
+        ai_game.step()
+        ai_game._update_screen()
+        profiler.end_frame()
+
+    for number in range(frames):
+        frame(number)
+    #Allocations are counted on extra frames, as tracing slows everything down
+    alloc_kb = []
+    tracemalloc.start()
+    for number in range(frames, frames + alloc_frames):
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        frame(number)
+        alloc_kb.append((tracemalloc.get_traced_memory()[1] - before) / 1024)
+    tracemalloc.stop()
+
+    #The headless loop has no events to read and never sleeps
+    phases = {phase: statistics.mean(row[index] for row in profiler.rows)
+        for index, phase in enumerate(profiler.phases) if phase not in ("events", "sleep")}
+    peak_rss_mb = None
+    if resource is not None:
+        #Linux reports kilobytes, macOS bytes
+        scale = 1 if sys.platform == "darwin" else 1024
+        peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / 2**20
+    pygame.quit()
+    return {"frames": frames, "phases_ms": phases, "frame_ms": sum(phases.values()),
+        "alloc_kb_per_frame": statistics.mean(alloc_kb) if alloc_kb else 0.0,
+        "peak_rss_mb": peak_rss_mb, "level": ai_game.stats.level,
+        "aliens": len(ai_game.aliens)}
+
+
+def measure(name, frames, alloc_frames):
+    """Run scenario name in a fresh interpreter and return its results"""
+    env = dict(os.environ)
+    env["SDL_VIDEODRIVER"] = "dummy"
+    env["SDL_AUDIODRIVER"] = "dummy"
+    output = subprocess.run([sys.executable, __file__, "--child", name,
+        "--frames", str(frames), "--alloc-frames", str(alloc_frames)],
+        env=env, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def compare(results, baseline, threshold):
+    """Print each compared result against the baseline; return the regressions"""
+    regressions = []
+    for name, result in results.items():
+        old = baseline.get(name)
+        if old is None:
+            print(f"{name:>12}: not in baseline")
+            continue
+        for key in COMPARED:
+            if result[key] is None or not old.get(key):
+                continue
+            change = (result[key] - old[key]) / old[key] * 100
+            regressed = change > threshold
+            print(f"{name:>12} {key:<19} {old[key]:10.3f} -> {result[key]:10.3f}"
+                f"  {change:+6.1f}%{'  REGRESSION' if regressed else ''}")
+            if regressed:
+                regressions.append((name, key))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), action="append",
+        help="scenario to run; repeat for several (default: all)")
+    parser.add_argument("--frames", type=int, default=1200)
+    parser.add_argument("--alloc-frames", type=int, default=120,
+        help="extra frames played with allocation tracing on")
+    parser.add_argument("--save", metavar="FILE", help="write the results as a JSON baseline")
+    parser.add_argument("--compare", metavar="FILE", help="JSON baseline to check against")
+    parser.add_argument("--threshold", type=float, default=10.0,
+        help="percent a compared result may grow before it counts as a regression")
+    parser.add_argument("--child", metavar="SCENARIO", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_scenario(args.child, args.frames, args.alloc_frames)))
+        return 0
+
+    results = {}
+    for name in args.scenario or SCENARIOS:
+        result = measure(name, args.frames, args.alloc_frames)
+        results[name] = result
+        phases = "  ".join(f"{phase} {ms:.3f}" for phase, ms in result["phases_ms"].items())
+        rss = "n/a" if result["peak_rss_mb"] is None else f"{result['peak_rss_mb']:.1f} MB"
+        print(f"{name:>12}: {result['frame_ms']:.3f} ms/frame ({phases})"
+            f"  {result['alloc_kb_per_frame']:.1f} KB/frame  peak RSS {rss}")
+    if args.save:
+        Path(args.save).write_text(json.dumps(results, indent=2) + "\n")
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        regressions = compare(results, baseline, args.threshold)
+        print(f"{len(regressions)} regression(s) past {args.threshold:g}%")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
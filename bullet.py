@@ -1,5 +1,5 @@
 import pygame
-from pygame.sprite import AbstractGroup, Sprite
+from pygame.sprite import Sprite
 
 class Bullet(Sprite):
     """A class to manage bullets"""
@@ -7,25 +7,27 @@ class Bullet(Sprite):
     def __init__(self, ai_game) -> None:
         """Create a bullet object at the ship's position"""
         super().__init__()
-        self.screen = ai_game.screen
         self.settings = ai_game.settings
-        self.color = self.settings.bullet_color
+
+        self.ship = ai_game.ship
 
         #Create a bullet rect at (0, 0) and then set correct position
         self.rect = pygame.Rect(0, 0, self.settings.bullet_width, self.settings.bullet_height)
-        self.rect.midtop = ai_game.ship.rect.midtop
+        self.reset()
+
 
+    def reset(self):
+        """Move the bullet back to the ship so it can be fired again"""
+        self.rect.midtop = self.ship.rect.midtop
         #Store bullet's position as a float
         self.y = float(self.rect.y)
+        self.prev_y = self.y
 
 
     def update(self):
         """Move the bullet up the screen"""
         #Update the exact position of the bullet
-        self.y -= self.settings.bullet_speed
+        self.prev_y = self.y
+        self.y -= self.settings.bullet_speed * self.settings.tick_scale
         #Update the rect position
-        self.rect.y = self.y
-
-    def draw_bullet(self):
-        """Draw the bullet on the screen"""
-        pygame.draw.rect(self.screen, self.color, self.rect)
\ No newline at end of file
+        self.rect.y = self.y
\ No newline at end of file
@@ -9,7 +9,7 @@ class Button:
         self.screen_rect = self.screen.get_rect()
         #Set dimensions and properties of button
         self.width, self.height = 200, 50
-        self.button_color = (0, 135, 0)
+        self.button_color = ai_game.settings.button_color
         self.text_color = (255, 255, 255)
         self.font = pygame.font.SysFont(None, 48)
         #Build buttons rect object and center it
@@ -22,11 +22,7 @@ class Button:
     def _prep_msg(self, msg):
         """Turn text into rendered image and center on button"""
         self.msg_image = self.font.render(msg, True, self.text_color, self.button_color)
-        self.msg_image_rect = self.msg_image.get_rect()
-        self.msg_image_rect.center = self.rect.center
-
-
-    def draw_button(self):
-        """Draw blank button then draw message"""
-        self.screen.fill(self.button_color, self.rect)
-        self.screen.blit(self.msg_image, self.msg_image_rect)
\ No newline at end of file
+        #Whole button as one image for the render backend
+        self.image = pygame.Surface(self.rect.size)
+        self.image.fill(self.button_color)
+        self.image.blit(self.msg_image, self.msg_image.get_rect(center=self.image.get_rect().center))
\ No newline at end of file
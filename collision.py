@@ -0,0 +1,71 @@
+from math import floor
+
+
+class SpatialGrid:
+    """A class to bucket fleet slots into a uniform grid of cells
+
+    Positions are stored relative to the fleet, so a rigidly moving fleet
+    never needs rebuilding; only dead aliens are removed.
+    """
+
+    def __init__(self, cell_width, cell_height) -> None:
+        """Initialize an empty grid with the given cell size"""
+        self.cell_width = max(1, cell_width)
+        self.cell_height = max(1, cell_height)
+        self.cells = {}
+        #Cells each slot was filed under, so removal skips the search
+        self.slot_cells = {}
+
+
+    def clear(self):
+        """Remove every slot"""
+        self.cells.clear()
+        self.slot_cells.clear()
+
+
+    def _cell_span(self, left, top, right, bottom):
+        """Return the cell keys covering a box"""
+        first_col, last_col = floor(left / self.cell_width), floor(right / self.cell_width)
+        first_row, last_row = floor(top / self.cell_height), floor(bottom / self.cell_height)
+        return [(col, row) for col in range(first_col, last_col + 1)
+                for row in range(first_row, last_row + 1)]
+
+
+    def insert(self, slot, left, top, width, height):
+        """File slot under every cell its box touches"""
+        keys = self._cell_span(left, top, left + width, top + height)
+        for key in keys:
+            self.cells.setdefault(key, []).append(slot)
+        self.slot_cells[slot] = keys
+
+
+    def snapshot(self):
+        """Return a copy of the grid's contents for restore()"""
+        return ({key: tuple(slots) for key, slots in self.cells.items()}, dict(self.slot_cells))
+
+
+    def restore(self, snapshot):
+        """Replace the grid's contents with a snapshot"""
+        cells, slot_cells = snapshot
+        self.cells = {key: list(slots) for key, slots in cells.items()}
+        self.slot_cells = dict(slot_cells)
+
+
+    def remove(self, slot):
+        """Take slot out of the grid"""
+        for key in self.slot_cells.pop(slot, ()):
+            bucket = self.cells[key]
+            bucket.remove(slot)
+            if not bucket:
+                del self.cells[key]
+
+
+    def query(self, left, top, right, bottom):
+        """Return the sorted slots that might overlap a box"""
+        #Pad by a pixel so rounded screen positions are never missed
+        found = set()
+        for key in self._cell_span(left - 1, top - 1, right + 1, bottom + 1):
+            bucket = self.cells.get(key)
+            if bucket:
+                found.update(bucket)
+        return sorted(found)
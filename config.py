@@ -0,0 +1,78 @@
+"""Read Settings changes from JSON or TOML settings files.
+
+A settings file holds setting names and the values to use instead of the
+preset's, for example:
+
+    {"bullets_allowed": 500, "alien_speed": 2.0, "fleet_rows": 2,
+     "level_curves": {"alien_speed": [1.0, 1.5, 2.5], "bullets_allowed": [3, 5, 8]}}
+
+Files are parsed once and cached until they change on disk.
+"""
+import json
+from pathlib import Path
+from time import perf_counter
+try:
+    import tomllib
+except ImportError:
+    #Python before 3.11 has no TOML reader, so only JSON works there
+    tomllib = None
+
+
+_files = {}
+
+
+def load_settings_file(path):
+    """Return the setting changes in a .json or .toml file"""
+    path = Path(path)
+    mtime = path.stat().st_mtime_ns
+    cached = _files.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    if path.suffix == ".toml":
+        if tomllib is None:
+            raise ValueError(f"{path}: TOML settings need Python 3.11 or later, use JSON")
+        with open(path, "rb") as file:
+            changes = tomllib.load(file)
+    else:
+        with open(path) as file:
+            changes = json.load(file)
+    if not isinstance(changes, dict):
+        raise ValueError(f"{path}: expected a table of setting names and values")
+    _files[path] = (mtime, changes)
+    return changes
+
+
+class FileWatcher:
+    """A class to notice when a file changes by polling its modified time
+
+    The file is looked at no more than once every interval seconds, however
+    often changed() is called.
+    """
+
+    def __init__(self, path, interval=1.0) -> None:
+        """Watch path, starting from how it is now"""
+        self.path = Path(path)
+        self.interval = interval
+        self.mtime = self._mtime()
+        self.next_check = perf_counter() + interval
+
+
+    def _mtime(self):
+        """Return the file's modified time, or None while it is missing"""
+        try:
+            return self.path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+
+    def changed(self):
+        """Return True once after each change to the file"""
+        now = perf_counter()
+        if now < self.next_check:
+            return False
+        self.next_check = now + self.interval
+        mtime = self._mtime()
+        if mtime is None or mtime == self.mtime:
+            return False
+        self.mtime = mtime
+        return True
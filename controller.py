@@ -0,0 +1,52 @@
+class GameController:
+    """A class that lets code play AlienInvasion the way a player would
+
+    Wraps the game's own entry points (_start_game, the ship's movement
+    flags, _fire_bullet and _fire_rocket) so bots never reach into them.
+    """
+
+    def __init__(self, ai_game) -> None:
+        """Control ai_game"""
+        self.ai_game = ai_game
+        self.has_rockets = ai_game.rockets is not None
+
+
+    def start(self):
+        """Start a new game, as clicking Play does"""
+        self.ai_game.settings.initialize_dynamic_settings()
+        self.ai_game._start_game()
+
+
+    def move(self, direction):
+        """Hold left (-1), right (1) or neither (0)"""
+        ship = self.ai_game.ship
+        ship.moving_left = direction < 0
+        ship.moving_right = direction > 0
+
+
+    def fire(self):
+        """Fire a bullet if one is available"""
+        self.ai_game._fire_bullet()
+
+
+    def fire_rocket(self):
+        """Fire a rocket, if this game has them"""
+        if self.has_rockets:
+            self.ai_game._fire_rocket()
+
+
+    def step(self):
+        """Advance the game by one simulation tick"""
+        self.ai_game.step()
+
+
+    @property
+    def game_over(self):
+        """True once the last ship is lost"""
+        return not self.ai_game.game_active
+
+
+    @property
+    def stats(self):
+        """The game's GameStats"""
+        return self.ai_game.stats
@@ -0,0 +1,168 @@
+import numpy as np
+from controller import GameController
+
+
+#Each action is (move direction, fire a bullet, fire a rocket)
+ACTIONS = ((0, False, False), (-1, False, False), (1, False, False),
+    (0, True, False), (-1, True, False), (1, True, False),
+    (0, False, True), (-1, False, True), (1, False, True))
+
+
+class AlienInvasionEnv:
+    """A gym-style reset/step interface around a headless AlienInvasion
+
+    Observations are written into buffers allocated once, so the array
+    returned by reset() and step() is overwritten by the next step; copy
+    it if you need to keep it. Pixel observations are a (height, width, 3)
+    RGB view straight onto the headless game's frame buffer.
+    """
+
+    def __init__(self, ai_game, observation="state", pixel_stride=1, max_steps=None) -> None:
+        """Wrap ai_game; observation is "state" or "pixels" """
+        self.ai_game = ai_game
+        self.controller = GameController(ai_game)
+        self.observation = observation
+        self.pixel_stride = pixel_stride
+        self.max_steps = max_steps
+        self.actions = ACTIONS if self.controller.has_rockets else ACTIONS[:6]
+        settings = ai_game.settings
+        #Room for every fleet slot and every projectile that can be in flight
+        self.alien_slots = len(ai_game.aliens.x)
+        self.bullet_slots = settings.bullets_allowed
+        self.rocket_slots = settings.rockets_allowed if self.controller.has_rockets else 0
+        size = 2 + 3 * self.alien_slots + 2 * self.bullet_slots + 2 * self.rocket_slots
+        self.state = np.zeros(size, dtype=np.float32)
+        #Named views into the state buffer
+        start = 2
+        self.alien_x, start = self.state[start:start + self.alien_slots], start + self.alien_slots
+        self.alien_y, start = self.state[start:start + self.alien_slots], start + self.alien_slots
+        self.alien_alive, start = self.state[start:start + self.alien_slots], start + self.alien_slots
+        self.bullet_xy, start = self.state[start:start + 2 * self.bullet_slots], start + 2 * self.bullet_slots
+        self.rocket_xy = self.state[start:start + 2 * self.rocket_slots]
+        if observation == "pixels":
+            if getattr(ai_game, "frame_buffer", None) is None:
+                raise ValueError("pixel observations need a headless game")
+            width, height = ai_game.screen.get_size()
+            frame = np.frombuffer(ai_game.frame_buffer, dtype=np.uint8).reshape(height, width, 4)
+            #Reading the BGRA bytes back to front gives RGB; striding downsamples
+            self.frame = frame[::pixel_stride, ::pixel_stride, 2::-1]
+        self.steps = 0
+        self.last_score = 0
+
+
+    def reset(self):
+        """Start a new game and return the first observation"""
+        self.controller.start()
+        self.steps = 0
+        self.last_score = 0
+        return self._observe()
+
+
+    def step(self, action):
+        """Play action for one tick; return (observation, reward, done, info)
+
+        action is an index into self.actions or a (move, fire, rocket) tuple.
+        """
+        move, fire, rocket = self.actions[action] if isinstance(action, (int, np.integer)) else action
+        self.controller.move(move)
+        if fire:
+            self.controller.fire()
+        if rocket:
+            self.controller.fire_rocket()
+        self.controller.step()
+        self.steps += 1
+        stats = self.ai_game.stats
+        reward = stats.score - self.last_score
+        self.last_score = stats.score
+        done = self.controller.game_over or (self.max_steps is not None and self.steps >= self.max_steps)
+        return self._observe(), reward, done, {"level": stats.level, "ships_left": stats.ships_left}
+
+
+    def _observe(self):
+        """Return the current observation"""
+        if self.observation == "pixels":
+            return self._observe_pixels()
+        return self._observe_state()
+
+
+    def _observe_state(self):
+        """Write ship, fleet and projectile positions into the state buffer"""
+        ai_game = self.ai_game
+        state = self.state
+        state[0] = ai_game.ship.x
+        state[1] = ai_game.settings.fleet_direction
+        aliens = ai_game.aliens
+        count = min(len(aliens.x), self.alien_slots)
+        np.copyto(self.alien_x[:count], aliens.x[:count])
+        np.copyto(self.alien_y[:count], aliens.y[:count])
+        np.copyto(self.alien_alive[:count], aliens.alive[:count])
+        self.alien_alive[count:] = 0
+        self._write_projectiles(self.bullet_xy, ai_game.bullets)
+        if self.rocket_slots:
+            self._write_projectiles(self.rocket_xy, ai_game.rockets)
+        return state
+
+
+    def _write_projectiles(self, buffer, projectiles):
+        """Write (x, y) pairs for projectiles in flight, zeroing unused slots"""
+        slot = 0
+        for projectile in projectiles:
+            if slot >= len(buffer):
+                break
+            buffer[slot] = projectile.rect.x
+            buffer[slot + 1] = projectile.y
+            slot += 2
+        buffer[slot:] = 0
+
+
+    def _observe_pixels(self):
+        """Draw the frame and return the view of it"""
+        self.ai_game._update_screen()
+        return self.frame
+
+
+class VectorEnv:
+    """A class to step several environments with one call
+
+    State observations are gathered into one (K, N) array allocated once.
+    Pixel observations come back as a list of per-game views. Finished
+    games are reset automatically.
+    """
+
+    def __init__(self, envs) -> None:
+        """Step envs together"""
+        self.envs = list(envs)
+        self.pixels = self.envs[0].observation == "pixels"
+        if not self.pixels:
+            self.states = np.zeros((len(self.envs), len(self.envs[0].state)), dtype=np.float32)
+        self.rewards = np.zeros(len(self.envs), dtype=np.float32)
+        self.dones = np.zeros(len(self.envs), dtype=bool)
+
+
+    def reset(self):
+        """Reset every environment and return their observations"""
+        return self._gather([env.reset() for env in self.envs])
+
+
+    def step(self, actions):
+        """Play one action per environment; return (observations, rewards, dones, infos)"""
+        observations, infos = [], []
+        for index, (env, action) in enumerate(zip(self.envs, actions)):
+            observation, reward, done, info = env.step(action)
+            if done:
+                info["final_score"] = env.ai_game.stats.score
+                observation = env.reset()
+            self.rewards[index] = reward
+            self.dones[index] = done
+            observations.append(observation)
+            infos.append(info)
+        return self._gather(observations), self.rewards, self.dones, infos
+
+
+    def _gather(self, observations):
+        """Copy state observations into the shared batch array"""
+        if self.pixels:
+            return observations
+        for row, observation in zip(self.states, observations):
+            np.copyto(row, observation)
+        return self.states
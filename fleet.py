@@ -0,0 +1,192 @@
+import numpy as np
+import pygame
+from collision import SpatialGrid
+
+
+def to_pixels(values):
+    """Round float positions to whole pixels the way a pygame Rect does, half away from zero"""
+    return np.copysign(np.floor(np.abs(values) + 0.5), values)
+
+
+class AlienFleet:
+    """A class to manage the whole alien fleet as position arrays"""
+
+    def __init__(self, ai_game, image) -> None:
+        """Initialize an empty fleet that draws every alien with image"""
+        self.screen = ai_game.screen
+        self.settings = ai_game.settings
+        #Every alien shares one image, so one size describes them all
+        self.image = image
+        self.width, self.height = image.get_size()
+        #Broadphase grid with one cell per formation slot
+        self.grid = SpatialGrid(2 * self.width, 2 * self.height)
+        self.empty()
+
+
+    def empty(self):
+        """Remove every alien"""
+        self.x = np.zeros(0)
+        self.y = np.zeros(0)
+        self.alive = np.zeros(0, dtype=bool)
+        self.count = 0
+        self._find_extremes()
+        self.grid.clear()
+        #How far the fleet has moved since it was built
+        self.offset_x = 0.0
+        self.offset_y = 0.0
+        #How far it moved across on the last tick, for drawing between ticks
+        self.last_step = 0.0
+
+
+    def build(self, xs, ys):
+        """Replace the fleet with aliens at the given top left positions"""
+        self.x = np.array(xs, dtype=float)
+        self.y = np.array(ys, dtype=float)
+        self.alive = np.ones(len(self.x), dtype=bool)
+        self.count = len(self.x)
+        self._find_extremes()
+        self.grid.clear()
+        self.offset_x = 0.0
+        self.offset_y = 0.0
+        self.last_step = 0.0
+        for slot, (x, y) in enumerate(zip(self.x.tolist(), self.y.tolist())):
+            self.grid.insert(slot, x, y, self.width, self.height)
+
+
+    def build_layout(self, layout):
+        """Replace the fleet with a cached formation Layout"""
+        if layout.grid is None:
+            self.build(layout.xs, layout.ys)
+            layout.grid = self.grid.snapshot()
+            return
+        #Seen this layout before: copy its arrays and grid in bulk
+        self.x = layout.xs.copy()
+        self.y = layout.ys.copy()
+        self.alive = np.ones(len(layout), dtype=bool)
+        self.count = len(layout)
+        self._find_extremes()
+        self.grid.restore(layout.grid)
+        self.offset_x = 0.0
+        self.offset_y = 0.0
+        self.last_step = 0.0
+
+
+    def __len__(self):
+        """Number of aliens still alive"""
+        return self.count
+
+
+    def _find_extremes(self):
+        """Find the leftmost, rightmost and lowest live aliens
+
+        The fleet moves as one, so these stay the same aliens until one of
+        them is killed, and edge and bottom checks only look at them.
+        """
+        if not self.count:
+            self.leftmost = self.rightmost = self.lowest = None
+            return
+        self.leftmost = int(np.where(self.alive, self.x, np.inf).argmin())
+        self.rightmost = int(np.where(self.alive, self.x, -np.inf).argmax())
+        self.lowest = int(np.where(self.alive, self.y, -np.inf).argmax())
+
+
+    def _lefts(self):
+        """Whole pixel left edges, rounded the same way a Rect would"""
+        return to_pixels(self.x)
+
+
+    def update(self):
+        """Move every alien to the right or left"""
+        step = (self.settings.alien_speed * self.settings.fleet_direction
+            * self.settings.tick_scale)
+        self.x += step
+        self.offset_x += step
+        self.last_step = step
+
+
+    def check_edges(self):
+        """Return True if any live alien is at an edge of the screen"""
+        if not self.count:
+            return False
+        return bool(to_pixels(self.x[self.rightmost]) + self.width >= self.settings.screen_width
+            or to_pixels(self.x[self.leftmost]) <= 0)
+
+
+    def drop(self):
+        """Move every alien down by the fleet drop speed"""
+        self.y += self.settings.fleet_drop_speed
+        self.offset_y += self.settings.fleet_drop_speed
+
+
+    def reached_bottom(self):
+        """Return True if any live alien has reached the bottom of the screen"""
+        if not self.count:
+            return False
+        return bool(self.y[self.lowest] + self.height >= self.settings.screen_height)
+
+
+    def collide_rect(self, rect):
+        """Return indexes of live aliens overlapping rect"""
+        #Broadphase in fleet coordinates, then exact tests on the candidates
+        candidates = self.grid.query(rect.left - self.offset_x, rect.top - self.offset_y,
+            rect.right - self.offset_x, rect.bottom - self.offset_y)
+        if not candidates:
+            return np.zeros(0, dtype=int)
+        candidates = np.array(candidates)
+        lefts = to_pixels(self.x[candidates])
+        tops = self.y[candidates]
+        hits = ((lefts < rect.right) & (lefts + self.width > rect.left)
+                & (tops < rect.bottom) & (tops + self.height > rect.top)
+                & self.alive[candidates])
+        return candidates[hits]
+
+
+    def kill(self, indexes):
+        """Remove the aliens at indexes from the fleet"""
+        self.alive[indexes] = False
+        for slot in np.atleast_1d(indexes).tolist():
+            self.grid.remove(slot)
+        self.count = int(np.count_nonzero(self.alive))
+        #Only look for new extremes when an extreme alien was killed
+        if not self.count or not self.alive[[self.leftmost, self.rightmost, self.lowest]].all():
+            self._find_extremes()
+
+
+    def collide_group(self, group, dokill_group, dokill_aliens):
+        """Collide a sprite group with the fleet like pygame's groupcollide
+
+        Returns a dict mapping each sprite that hit something to the list of
+        alien indexes it hit.
+        """
+        collisions = {}
+        if not self.count:
+            return collisions
+        for sprite in group:
+            hits = self.collide_rect(sprite.rect)
+            if len(hits):
+                collisions[sprite] = hits.tolist()
+                if dokill_aliens:
+                    self.kill(hits)
+        #Remove spent sprites after the loop so the group is not copied
+        if dokill_group:
+            for sprite in collisions:
+                group.remove(sprite)
+        return collisions
+
+
+    def positions(self, alpha=1.0):
+        """Return where to draw each live alien and the rect around them all
+
+        alpha below 1 places the fleet that far along its last step across;
+        drops are not interpolated.
+        """
+        if not self.count:
+            return [], None
+        if alpha < 1.0:
+            lefts = to_pixels(self.x + self.last_step * (alpha - 1.0))[self.alive]
+        else:
+            lefts = self._lefts()[self.alive]
+        tops = self.y[self.alive]
+        left, top = int(lefts.min()), int(tops.min())
+        return list(zip(lefts.tolist(), tops.tolist())), pygame.Rect(left, top,
+            int(lefts.max()) - left + self.width, int(tops.max()) - top + self.height)
@@ -0,0 +1,74 @@
+import numpy as np
+
+
+class Layout:
+    """Top left positions for every alien in a fleet, shared between levels"""
+
+    def __init__(self, xs, ys) -> None:
+        """Store read-only position arrays"""
+        xs.flags.writeable = False
+        ys.flags.writeable = False
+        self.xs = xs
+        self.ys = ys
+        #Broadphase grid built from these positions, filled in by the fleet
+        self.grid = None
+
+
+    def __len__(self):
+        """Number of alien slots"""
+        return len(self.xs)
+
+
+def _slots(screen_width, screen_height, width, height, rows=None, columns=None):
+    """Return the columns, rows and positions of the book's grid of slots
+
+    Aliens are one alien width and height apart, leaving room at the
+    right edge and three alien heights above the bottom of the screen.
+    rows and columns limit the grid to fewer than fit.
+    """
+    columns = np.arange(width, screen_width - 2 * width, 2 * width)[:columns]
+    rows = np.arange(height, screen_height - 3 * height, 2 * height)[:rows]
+    xs, ys = np.meshgrid(columns, rows)
+    column_numbers, row_numbers = np.meshgrid(np.arange(len(columns)), np.arange(len(rows)))
+    return column_numbers, row_numbers, xs, ys
+
+
+def grid(column_numbers, row_numbers):
+    """Fill every slot"""
+    return np.ones(column_numbers.shape, dtype=bool)
+
+
+def checker(column_numbers, row_numbers):
+    """Fill alternate slots like a checkerboard"""
+    return (column_numbers + row_numbers) % 2 == 0
+
+
+def wedge(column_numbers, row_numbers):
+    """Fill a triangle that widens by one slot each side per row"""
+    center = column_numbers.max(initial=0) // 2
+    return np.abs(column_numbers - center) <= row_numbers
+
+
+def diamond(column_numbers, row_numbers):
+    """Fill a diamond centered in the grid"""
+    center_column = column_numbers.max(initial=0) / 2
+    center_row = row_numbers.max(initial=0) / 2
+    radius = max(center_row, 1)
+    return (np.abs(column_numbers - center_column) + np.abs(row_numbers - center_row)) <= radius
+
+
+FORMATIONS = {"grid": grid, "checker": checker, "wedge": wedge, "diamond": diamond}
+_layouts = {}
+
+
+def layout(screen_width, screen_height, width, height, formation="grid", rows=None, columns=None):
+    """Return the cached Layout for a screen size, alien size, formation and fleet size"""
+    key = (screen_width, screen_height, width, height, formation, rows, columns)
+    cached = _layouts.get(key)
+    if cached is None:
+        column_numbers, row_numbers, xs, ys = _slots(screen_width, screen_height, width, height,
+            rows, columns)
+        keep = FORMATIONS[formation](column_numbers, row_numbers)
+        cached = Layout(xs[keep].astype(float), ys[keep].astype(float))
+        _layouts[key] = cached
+    return cached
@@ -1,15 +0,0 @@
-class GameStats:
-    '''track statistics for alien invasion'''
-    def __init__(self, ai_game) -> None:
-        '''initialize statistics'''
-        self.settings = ai_game.settings
-        self.reset_stats()
-        #High score should never be reset
-        self.high_score = 0
-    
-
-    def reset_stats(self):
-        '''initialize stats that can change throughout the game'''
-        self.ships_left = self.settings.ship_limit
-        self.score = 0
-        self.level = 1
\ No newline at end of file
@@ -0,0 +1,11 @@
+from enum import Enum
+
+
+class GameState(Enum):
+    """The states the game moves between"""
+    PLAYING = 1
+    #Short holds counted in simulation ticks, so the window keeps responding
+    RESPAWN_PAUSE = 2
+    LEVEL_TRANSITION = 3
+    #Waiting for the player to press Play
+    GAME_OVER = 4
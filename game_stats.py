@@ -1,5 +1,4 @@
-from pathlib import Path
-import json
+from uuid import uuid4
 
 
 class GameStats:
@@ -8,23 +7,22 @@ class GameStats:
     def __init__(self, ai_game) -> None:
         """Initialize stats"""
         self.settings = ai_game.settings
+        self.high_scores = ai_game.high_scores
+        self.player = ai_game.player
         self.reset_stats()
         #High score should never be reset
-        self.high_score = self.save_high_score()
+        self.high_score = self.high_scores.best(self.player)
 
 
-    def save_high_score(self):
-        """Checks high score and saves highest score"""
-        path = Path("highest_score.json")
-        try:
-            contents = path.read_text()
-            return json.loads(contents)
-        except FileNotFoundError:
-            return 0
+    def save_score(self):
+        """Record this game's score in the player's leaderboard"""
+        self.high_scores.record(self.player, self.game_id, self.score)
 
 
     def reset_stats(self):
         """Initialize stats that can change during game"""
         self.ships_left = self.settings.ship_limit
+        #Identifies this game's leaderboard entry between checkpoints
+        self.game_id = uuid4().hex
         self.score = 0
         self.level = 1
\ No newline at end of file
@@ -0,0 +1,49 @@
+from collections import OrderedDict
+import pygame
+
+
+class NumberRenderer:
+    """A class to draw numbers from cached digit glyphs
+
+    Each glyph is rendered with the font once. Whole strings are composed
+    by blitting glyphs, and recently drawn strings are kept in a small LRU.
+    """
+
+    def __init__(self, font, text_color, bg_color, cache_size=64) -> None:
+        """Pre-render the digit and comma glyphs"""
+        self.font = font
+        self.text_color = text_color
+        self.bg_color = bg_color
+        self.cache_size = cache_size
+        self.glyphs = {char: font.render(char, True, text_color, bg_color)
+            for char in "0123456789,"}
+        self.height = max(glyph.get_height() for glyph in self.glyphs.values())
+        self.recent = OrderedDict()
+
+
+    def render(self, text):
+        """Return an image of text, reusing a recent one when possible"""
+        image = self.recent.get(text)
+        if image is not None:
+            self.recent.move_to_end(text)
+            return image
+        image = self._compose(text)
+        self.recent[text] = image
+        if len(self.recent) > self.cache_size:
+            self.recent.popitem(last=False)
+        return image
+
+
+    def _compose(self, text):
+        """Blit glyphs side by side, falling back to the font for other text"""
+        if not all(char in self.glyphs for char in text):
+            return self.font.render(text, True, self.text_color, self.bg_color)
+        glyphs = [self.glyphs[char] for char in text]
+        image = pygame.Surface((sum(glyph.get_width() for glyph in glyphs), self.height))
+        image.fill(self.bg_color)
+        x, placed = 0, []
+        for glyph in glyphs:
+            placed.append((glyph, (x, 0)))
+            x += glyph.get_width()
+        image.blits(placed, doreturn=False)
+        return image
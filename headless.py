@@ -0,0 +1,60 @@
+import os
+import pygame
+
+
+def use_dummy_drivers():
+    """Point SDL at its dummy drivers so no window or sound device opens"""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+
+class ScriptedInput:
+    """A class to feed planned input events to the game by frame number"""
+
+    def __init__(self) -> None:
+        """Start with an empty script"""
+        self.script = {}
+
+
+    def add(self, frame, event):
+        """Queue an event to be handled at the start of frame"""
+        self.script.setdefault(frame, []).append(event)
+
+
+    def key_down(self, frame, key):
+        """Press key on frame"""
+        self.add(frame, pygame.event.Event(pygame.KEYDOWN, key=key))
+
+
+    def key_up(self, frame, key):
+        """Release key on frame"""
+        self.add(frame, pygame.event.Event(pygame.KEYUP, key=key))
+
+
+    def tap(self, frame, key, hold=1):
+        """Press key on frame and release it hold frames later"""
+        self.key_down(frame, key)
+        self.key_up(frame + hold, key)
+
+
+    def click(self, frame, pos):
+        """Click the left mouse button at pos on frame"""
+        self.add(frame, pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1))
+
+
+    def events(self, frame):
+        """Return the events planned for frame"""
+        return self.script.get(frame, ())
+
+
+def run_headless(ai_game, frames, script=None, observers=()):
+    """Step the simulation frames times as fast as the CPU allows"""
+    for frame in range(frames):
+        if script is not None:
+            for event in script.events(frame):
+                ai_game._handle_event(event)
+        ai_game.step()
+        #Observers (e.g. a renderer) look at the state after each step
+        for observer in observers:
+            observer()
+    return frames
@@ -0,0 +1,111 @@
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+
+class HighScoreStore:
+    """A class to keep a top-N leaderboard per player on disk
+
+    Scores are updated in memory and written by a background thread, so
+    the game loop never waits on the disk. Each write goes to a temporary
+    file that then replaces the real one, so a crash mid-write can't
+    corrupt the saved scores. With no path, scores only live in memory.
+    """
+
+    def __init__(self, path=None, top_n=10) -> None:
+        """Load the saved leaderboards and start the writer thread"""
+        self.path = Path(path) if path is not None else None
+        self.top_n = top_n
+        self.boards = self._read()
+        self.lock = threading.Lock()
+        self.pending = None
+        self.wake = threading.Event()
+        self.stopping = False
+        self.thread = None
+        if self.path is not None:
+            self.thread = threading.Thread(target=self._write_loop, daemon=True)
+            self.thread.start()
+
+
+    def _read(self):
+        """Return the leaderboards saved at path"""
+        if self.path is None:
+            return {}
+        try:
+            contents = json.loads(self.path.read_text())
+        except (FileNotFoundError, ValueError):
+            return {}
+        #Older saves hold a single number: the best score ever
+        if isinstance(contents, (int, float)):
+            return {"default": [{"score": contents, "game": "legacy"}]}
+        return contents
+
+
+    def best(self, player):
+        """Return the best score saved for player"""
+        board = self.boards.get(player)
+        return board[0]["score"] if board else 0
+
+
+    def leaderboard(self, player):
+        """Return player's entries, best first"""
+        return list(self.boards.get(player, ()))
+
+
+    def record(self, player, game, score):
+        """Record a game's score, replacing that game's earlier checkpoint"""
+        if score <= 0:
+            return
+        with self.lock:
+            board = [entry for entry in self.boards.get(player, ()) if entry["game"] != game]
+            board.append({"score": score, "game": game})
+            board.sort(key=lambda entry: entry["score"], reverse=True)
+            self.boards[player] = board[:self.top_n]
+            if self.thread is not None:
+                self.pending = json.dumps(self.boards)
+                self.wake.set()
+
+
+    def _write_loop(self):
+        """Write the latest leaderboards whenever they change"""
+        while True:
+            self.wake.wait()
+            with self.lock:
+                self.wake.clear()
+                contents, self.pending = self.pending, None
+            if contents is not None:
+                try:
+                    self._write(contents)
+                except OSError:
+                    #Keep playing; the next change rewrites every score
+                    pass
+            #A score recorded during that write still has to reach the disk
+            with self.lock:
+                if self.stopping and self.pending is None:
+                    return
+
+
+    def _write(self, contents):
+        """Write contents to a temporary file, then swap it into place"""
+        handle, temp_path = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name)
+        try:
+            with os.fdopen(handle, "w") as file:
+                file.write(contents)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, self.path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+
+    def close(self):
+        """Finish any pending write and stop the writer thread"""
+        if self.thread is None:
+            return
+        self.stopping = True
+        self.wake.set()
+        self.thread.join()
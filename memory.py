@@ -0,0 +1,146 @@
+import atexit
+import gc
+import json
+import tracemalloc
+from time import perf_counter
+
+
+class GCMonitor:
+    """A class to count garbage collections and time their pauses by generation"""
+
+    def __init__(self) -> None:
+        """Start listening to the garbage collector"""
+        self.collections = [0, 0, 0]
+        self.pauses_ms = [[], [], []]
+        self.started = None
+        gc.callbacks.append(self._callback)
+
+
+    def _callback(self, phase, info):
+        """Time a collection from its start to its stop"""
+        if phase == "start":
+            self.started = perf_counter()
+        elif self.started is not None:
+            generation = info["generation"]
+            self.collections[generation] += 1
+            self.pauses_ms[generation].append((perf_counter() - self.started) * 1000)
+            self.started = None
+
+
+    def stop(self):
+        """Stop listening to the garbage collector"""
+        if self._callback in gc.callbacks:
+            gc.callbacks.remove(self._callback)
+
+
+    def report(self):
+        """Return collections, total and longest pause in ms for each generation"""
+        return {f"gen{generation}": {"collections": self.collections[generation],
+                "total_ms": sum(pauses), "max_ms": max(pauses, default=0.0)}
+            for generation, pauses in enumerate(self.pauses_ms)}
+
+
+class AllocationTracker:
+    """A class to record memory allocated each frame by call site
+
+    A tracemalloc snapshot is taken after every frame and compared with the
+    one before, so each line of code is charged with the memory it left
+    allocated that frame.  Snapshots are slow; this is for finding what to
+    fix, not for play.
+    """
+
+    def __init__(self, export_path=None, limit=25) -> None:
+        """Start tracing allocations and garbage collections"""
+        self.export_path = export_path
+        self.limit = limit
+        self.frames = 0
+        #Bytes and blocks each call site grew by over all frames
+        self.sites = {}
+        #Most memory in use during each frame, over what it started with
+        self.peaks_kb = []
+        self.gc = GCMonitor()
+        tracemalloc.start()
+        self.snapshot = self._snapshot()
+        self.frame_start = tracemalloc.get_traced_memory()[0]
+        if export_path:
+            atexit.register(self.export)
+
+
+    def _snapshot(self):
+        """Take a snapshot leaving out tracemalloc's and this tracker's own memory"""
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<unknown>")))
+
+
+    def frame(self):
+        """Charge this frame's allocations to their call sites"""
+        peak = tracemalloc.get_traced_memory()[1]
+        self.peaks_kb.append((peak - self.frame_start) / 1024)
+        snapshot = self._snapshot()
+        for stat in snapshot.compare_to(self.snapshot, "lineno"):
+            if stat.size_diff > 0:
+                frame = stat.traceback[0]
+                site = f"{frame.filename}:{frame.lineno}"
+                size, count = self.sites.get(site, (0, 0))
+                self.sites[site] = (size + stat.size_diff, count + max(stat.count_diff, 0))
+        self.snapshot = snapshot
+        self.frames += 1
+        #Measure the next frame from here, so taking the snapshot is not counted
+        tracemalloc.reset_peak()
+        self.frame_start = tracemalloc.get_traced_memory()[0]
+
+
+    def report(self):
+        """Return the top call sites by memory per frame, and GC activity"""
+        frames = max(self.frames, 1)
+        sites = sorted(self.sites.items(), key=lambda item: -item[1][0])[:self.limit]
+        return {"frames": self.frames,
+            "peak_kb_per_frame": sum(self.peaks_kb) / frames,
+            "call_sites": [{"site": site, "kb_per_frame": size / 1024 / frames,
+                    "blocks_per_frame": count / frames}
+                for site, (size, count) in sites],
+            "gc": self.gc.report()}
+
+
+    def export(self, path=None):
+        """Write the report as JSON and stop tracing"""
+        with open(path or self.export_path, "w") as file:
+            json.dump(self.report(), file, indent=2)
+        tracemalloc.stop()
+        self.gc.stop()
+
+
+class GCPolicy:
+    """A class to keep garbage collection out of play
+
+    After start up every object then alive is frozen, so collections never
+    look at the game's assets again, and the collector runs between levels,
+    when a pause can't be seen.  During play it only runs if young_limit
+    container objects pile up, as a guard against unbounded growth.
+    """
+
+    def __init__(self, young_limit=100_000) -> None:
+        """Remember the collector's thresholds to put back in stop()"""
+        self.young_limit = young_limit
+        self.thresholds = gc.get_threshold()
+
+
+    def start(self):
+        """Collect once, freeze what is left and hold off collecting"""
+        gc.collect()
+        gc.freeze()
+        gc.set_threshold(self.young_limit, self.thresholds[1], self.thresholds[2])
+
+
+    def between_levels(self):
+        """Collect everything not frozen while play is paused"""
+        gc.collect()
+
+
+    def stop(self):
+        """Put the collector back to how it was"""
+        gc.set_threshold(*self.thresholds)
+        gc.unfreeze()
@@ -0,0 +1,84 @@
+from timestep import pixel
+
+
+class ProjectilePool:
+    """A class to recycle a fixed set of bullets or rockets in place
+
+    Acts like the sprite Group it replaces for len(), iteration, sprites(),
+    remove() and empty(), but never allocates once the pool is warm.
+    """
+
+    def __init__(self, ai_game, projectile_class, capacity) -> None:
+        """Create capacity projectiles up front"""
+        self.ai_game = ai_game
+        self.projectile_class = projectile_class
+        self.free = [projectile_class(ai_game) for _ in range(capacity)]
+        self.active = []
+
+
+    def __len__(self):
+        """Number of projectiles in flight"""
+        return len(self.active)
+
+
+    def __iter__(self):
+        """Iterate over projectiles in flight, oldest first"""
+        return iter(self.active)
+
+
+    def sprites(self):
+        """Return the live list of projectiles in flight; do not modify it"""
+        return self.active
+
+
+    def positions(self, alpha=1.0):
+        """Return where to draw each projectile, alpha of the way from its last tick"""
+        if alpha >= 1.0:
+            return [projectile.rect.topleft for projectile in self.active]
+        return [(projectile.rect.x,
+                pixel(projectile.prev_y + (projectile.y - projectile.prev_y) * alpha))
+            for projectile in self.active]
+
+
+    def hold(self):
+        """Keep every projectile where it is when drawn between ticks"""
+        for projectile in self.active:
+            projectile.prev_y = projectile.y
+
+
+    def fire(self):
+        """Launch a recycled projectile from the ship and return it"""
+        if self.free:
+            projectile = self.free.pop()
+        else:
+            #Only reached if the allowed count was raised after start up
+            projectile = self.projectile_class(self.ai_game)
+        projectile.reset()
+        self.active.append(projectile)
+        return projectile
+
+
+    def remove(self, projectile):
+        """Return a projectile in flight to the pool"""
+        self.active.remove(projectile)
+        self.free.append(projectile)
+
+
+    def empty(self):
+        """Return every projectile to the pool"""
+        self.free.extend(self.active)
+        self.active.clear()
+
+
+    def update(self):
+        """Move every projectile and recycle the ones off the top of the screen"""
+        active = self.active
+        kept = 0
+        for projectile in active:
+            projectile.update()
+            if projectile.rect.bottom > 0:
+                active[kept] = projectile
+                kept += 1
+            else:
+                self.free.append(projectile)
+        del active[kept:]
@@ -0,0 +1,36 @@
+"""Setting changes that turn the one engine into each Alien Invasion variant.
+
+Each preset maps setting names to the values that differ from the defaults in
+settings.py.  Paths are relative to the folder this file is in.
+"""
+
+PRESETS = {
+    #The loose files: the book's game with its art and freesound.org effects
+    "space": {},
+    #The game folder: full screen over a star field, with rockets
+    "game": {
+        "bg_color": (0, 0, 0),
+        "fullscreen": True,
+        "caption": "AlienInvasion",
+        "background_image": "game/images/space.bmp",
+        "ship_image": "game/images/ship2.bmp",
+        "alien_image": "game/images/enemy.bmp",
+        "button_color": (255, 0, 0),
+        "keyboard_start": False,
+        "scores_file": "game/highest_score.json",
+        "bullet_color": (228, 16, 4),
+        "bullets_allowed": 20,
+        "rockets_enabled": True,
+        "sound_dir": "game/SoundFX",
+        "sound_effects": {
+            "bullet": ("521550__omerbhatti34__laser-fire.mp3", "shot"),
+            "rocket": ("547441__mango777__lazercannon.ogg", "shot"),
+            "alien": ("514133__juverisetila__medium-explosion.mp3", "explosion"),
+            "rocket_hit": ("458683__jorgerosa__ufo-explosion-1.ogg", "explosion"),
+            "ship_hit": ("332628__treasuresounds__fx_explosion.ogg", "explosion"),
+        },
+        "music": "534167__meatsackj__short-game-music-loop.wav",
+        "ship_speed": 2,
+        "bullet_speed": 8.0,
+    },
+}
@@ -0,0 +1,173 @@
+import atexit
+import csv
+import json
+from collections import deque
+from time import perf_counter
+import pygame
+
+
+class FrameProfiler:
+    """A class to time each phase of the main loop
+
+    Nothing is timed until instrument() wraps a game, so a game without a
+    profiler runs exactly the code it always did.
+    """
+
+    def __init__(self, window=600, export_path=None) -> None:
+        """Keep percentiles over the last window frames"""
+        self.window = window
+        self.phases = []
+        self.samples = {}
+        self.current = {}
+        #Every frame's timings, for the export
+        self.rows = []
+        self.export_path = export_path
+        if export_path:
+            atexit.register(self.export)
+
+
+    def instrument(self, ai_game):
+        """Wrap the game's frame phases with timers"""
+        targets = [("events", ai_game, "_check_events"),
+            ("ship", ai_game.ship, "update")]
+        #Games without rockets have no rockets phase
+        if ai_game.rockets is not None:
+            targets.append(("rockets", ai_game, "_update_rockets"))
+        targets += [("bullets", ai_game, "_update_bullets"),
+            ("aliens", ai_game, "_update_aliens"),
+            ("screen", ai_game, "_update_screen")]
+        for phase, owner, name in targets:
+            self._wrap(phase, owner, name)
+        #Rendering is called through the observer list, so point it at the wrapper
+        timed_screen = ai_game._update_screen
+        ai_game.observers = [timed_screen if observer == timed_screen.__wrapped__ else observer
+            for observer in ai_game.observers]
+        ai_game.clock = TimedClock(ai_game.clock, self)
+
+
+    def _wrap(self, phase, owner, name):
+        """Replace owner.name with a timed version"""
+        self.phases.append(phase)
+        self.samples[phase] = deque(maxlen=self.window)
+        original = getattr(owner, name)
+        #The first phase of each frame closes the previous frame
+        starts_frame = len(self.phases) == 1
+
+        def timed(*args, **kwargs):
+            if starts_frame:
+                self.end_frame()
+            start = perf_counter()
+            result = original(*args, **kwargs)
+            self.add(phase, start)
+            return result
+
+        timed.__wrapped__ = original
+        setattr(owner, name, timed)
+
+
+    def add(self, phase, start):
+        """Add the time since start to phase for this frame"""
+        elapsed = (perf_counter() - start) * 1000
+        self.current[phase] = self.current.get(phase, 0.0) + elapsed
+
+
+    def end_frame(self):
+        """Store this frame's timings and start a new frame"""
+        if not self.current:
+            return
+        row = [self.current.get(phase, 0.0) for phase in self.phases]
+        self.rows.append(row)
+        for phase, ms in zip(self.phases, row):
+            self.samples[phase].append(ms)
+        self.current = {}
+
+
+    def percentiles(self, phase, quantiles=(0.5, 0.95, 0.99)):
+        """Return the rolling percentiles of phase in ms"""
+        ordered = sorted(self.samples.get(phase, ()))
+        if not ordered:
+            return [0.0 for quantile in quantiles]
+        return [ordered[int(quantile * (len(ordered) - 1))] for quantile in quantiles]
+
+
+    def export(self, path=None):
+        """Write every frame's timings as CSV, or JSON lines for a .jsonl path"""
+        path = str(path or self.export_path)
+        self.end_frame()
+        with open(path, "w", newline="") as file:
+            if path.endswith(".jsonl"):
+                for frame, row in enumerate(self.rows):
+                    record = dict(zip(self.phases, row), frame=frame)
+                    file.write(json.dumps(record) + "\n")
+            else:
+                writer = csv.writer(file)
+                writer.writerow(["frame"] + self.phases)
+                for frame, row in enumerate(self.rows):
+                    writer.writerow([frame] + [f"{ms:.4f}" for ms in row])
+
+
+class TimedClock:
+    """A stand-in for pygame's Clock that times the sleep in tick()"""
+
+    def __init__(self, clock, profiler) -> None:
+        """Wrap clock and report to profiler"""
+        self.clock = clock
+        self.profiler = profiler
+        profiler.phases.append("sleep")
+        profiler.samples["sleep"] = deque(maxlen=profiler.window)
+
+
+    def tick(self, framerate=0):
+        """Tick the real clock, timing the wait"""
+        start = perf_counter()
+        result = self.clock.tick(framerate)
+        self.profiler.add("sleep", start)
+        return result
+
+
+    def __getattr__(self, name):
+        """Pass everything else to the real clock"""
+        return getattr(self.clock, name)
+
+
+class ProfilerOverlay:
+    """A class to draw rolling phase timings beside the scoreboard"""
+
+    def __init__(self, ai_game, profiler, refresh_frames=30) -> None:
+        """Initialize the overlay under the level display"""
+        self.backend = ai_game.backend
+        self.sb = ai_game.sb
+        self.profiler = profiler
+        self.refresh_frames = refresh_frames
+        self.font = pygame.font.SysFont(None, 22)
+        self.text_color = (255, 255, 0)
+        self.bg_color = (20, 20, 20)
+        self.frames = 0
+        self.image = None
+
+
+    def _prep_image(self):
+        """Render one line per phase with its p50/p95/p99"""
+        lines = ["phase      p50    p95    p99 ms"]
+        for phase in self.profiler.phases:
+            p50, p95, p99 = self.profiler.percentiles(phase)
+            lines.append(f"{phase:<8} {p50:6.2f} {p95:6.2f} {p99:6.2f}")
+        images = [self.font.render(line, True, self.text_color, self.bg_color) for line in lines]
+        width = max(image.get_width() for image in images)
+        height = sum(image.get_height() for image in images)
+        self.image = pygame.Surface((width, height))
+        self.image.fill(self.bg_color)
+        y = 0
+        for image in images:
+            self.image.blit(image, (0, y))
+            y += image.get_height()
+        self.rect = self.image.get_rect()
+        self.rect.topright = (self.sb.level_rect.right, self.sb.level_rect.bottom + 10)
+
+
+    def __call__(self):
+        """Draw the overlay on top of the finished frame"""
+        if self.image is None or self.frames % self.refresh_frames == 0:
+            self._prep_image()
+        self.frames += 1
+        self.backend.overlay("profiler", self.image, self.rect)
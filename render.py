@@ -0,0 +1,251 @@
+import pygame
+from window import open_window
+try:
+    from pygame._sdl2 import video
+except ImportError:
+    #Some pygame builds have no SDL renderer module; only software drawing works there
+    video = None
+
+
+class DirtyRenderer:
+    """A class to redraw and push only the parts of the screen that changed
+
+    Moving things are erased from last frame's position every frame. Static
+    images (score, level, lives, buttons) only count as dirty when their
+    image or position changes, or when they appear or disappear.
+    """
+
+    def __init__(self, screen, backdrop) -> None:
+        """Initialize the renderer with the full-screen backdrop to erase with"""
+        self.screen = screen
+        self.backdrop = backdrop
+        #Rects of moving things drawn last frame and this frame
+        self.last_moving = []
+        self.moving = []
+        #Static images by key, as (surface, rect) for last frame and this frame
+        self.last_statics = {}
+        self.statics = {}
+        self.invalidate()
+
+
+    def invalidate(self):
+        """Redraw and push the whole screen on the next frame"""
+        self.full_redraw = True
+
+
+    def begin(self):
+        """Erase everything drawn last frame"""
+        if self.full_redraw:
+            self.screen.blit(self.backdrop, (0, 0))
+        else:
+            for rect in self.last_moving:
+                self.screen.blit(self.backdrop, rect, rect)
+            for surface, rect in self.last_statics.values():
+                self.screen.blit(self.backdrop, rect, rect)
+        self.moving = []
+        self.statics = {}
+
+
+    def moved(self, rect):
+        """Record the rect of something that was drawn and may move"""
+        if rect:
+            self.moving.append(pygame.Rect(rect))
+
+
+    def moved_all(self, rects):
+        """Record the rects returned by a blits() call"""
+        self.moving.extend(rects)
+
+
+    def blit_static(self, key, surface, rect):
+        """Draw a static image, tracked by key between frames"""
+        self.screen.blit(surface, rect)
+        self.statics[key] = (surface, pygame.Rect(rect))
+
+
+    def _static_changes(self):
+        """Return rects of static images that changed, appeared or vanished"""
+        changed = []
+        for key, (surface, rect) in self.statics.items():
+            old = self.last_statics.get(key)
+            if old is None or old[0] is not surface or old[1] != rect:
+                changed.append(rect)
+                if old is not None:
+                    changed.append(old[1])
+        for key, (surface, rect) in self.last_statics.items():
+            if key not in self.statics:
+                changed.append(rect)
+        return changed
+
+
+    def end(self):
+        """Push the dirty regions to the display"""
+        if self.full_redraw:
+            pygame.display.flip()
+            self.full_redraw = False
+        else:
+            pygame.display.update(self.last_moving + self.moving + self._static_changes())
+        self.last_moving = self.moving
+        self.last_statics = self.statics
+
+
+class SoftwareBackend:
+    """A class to draw frames with Surface blits to the display
+
+    Every backend is driven the same way each frame: begin() draws the
+    background, draw_layer() draws bullets, rockets, the ship and aliens in
+    that order, draw_static() draws the scoreboard and play button, then
+    present() shows the frame.
+    """
+
+    def __init__(self, settings, screen, backdrop, atlas) -> None:
+        """Initialize the backend to draw on screen from atlas"""
+        self.settings = settings
+        self.screen = screen
+        self.backdrop = backdrop
+        self.atlas = atlas
+        self.accelerated = False
+        #Only changed regions are redrawn while dirty rendering is on
+        self.renderer = DirtyRenderer(screen, backdrop)
+        self.dirty = settings.dirty_rendering
+
+
+    def begin(self):
+        """Draw the background, or erase last frame's changes"""
+        dirty = self.settings.dirty_rendering
+        if dirty and not self.dirty:
+            self.renderer.invalidate()
+        self.dirty = dirty
+        if dirty:
+            self.renderer.begin()
+        else:
+            self.screen.blit(self.backdrop, (0, 0))
+
+
+    def draw_layer(self, name, positions, bounds=None):
+        """Draw atlas image name at each position in one blits() call
+
+        bounds, when given, is the rect around every position, so only it
+        has to be tracked rather than a rect for each one.
+        """
+        sprites = self.atlas.layer(name, positions)
+        if not self.dirty:
+            self.screen.blits(sprites, doreturn=False)
+        elif bounds is None:
+            self.renderer.moved_all(self.screen.blits(sprites))
+        else:
+            self.screen.blits(sprites, doreturn=False)
+            self.renderer.moved(bounds)
+
+
+    def draw_static(self, key, image, rect):
+        """Draw an image that seldom changes, tracked by key between frames"""
+        if self.dirty:
+            self.renderer.blit_static(key, image, rect)
+        else:
+            self.screen.blit(image, rect)
+
+
+    def present(self):
+        """Show the frame"""
+        if self.dirty:
+            self.renderer.end()
+        else:
+            pygame.display.flip()
+
+
+    def overlay(self, key, image, rect):
+        """Draw image over the frame already shown, e.g. debug text"""
+        self.screen.blit(image, rect)
+        pygame.display.update(rect)
+
+
+class SDL2Backend:
+    """A class to draw frames with SDL's renderer and textures
+
+    The backdrop and atlas are uploaded as textures once, and static images
+    again only when they change, so a frame is composed by the renderer
+    instead of by copying pixels in Python's process.  SDL's software
+    renderer stands in when no GPU renderer starts, e.g. on CI machines,
+    unless software_fallback is False.
+    """
+
+    def __init__(self, settings, backdrop, atlas, software_fallback=True, fullscreen=False) -> None:
+        """Open the renderer's window and upload the textures"""
+        self.window = video.Window(settings.caption, backdrop.get_size(),
+            fullscreen_desktop=fullscreen)
+        try:
+            self.renderer = video.Renderer(self.window, accelerated=1)
+            self.accelerated = True
+        except video.error:
+            if not software_fallback:
+                self.window.destroy()
+                raise
+            self.renderer = video.Renderer(self.window, accelerated=0)
+            self.accelerated = False
+        #Draw in the game's size, scaled to fit a full screen window
+        self.renderer.logical_size = backdrop.get_size()
+        self.backdrop = video.Texture.from_surface(self.renderer, backdrop)
+        self.atlas_texture = video.Texture.from_surface(self.renderer, atlas.surface)
+        self.areas = atlas.areas
+        #Textures of static images by key, as (surface, texture)
+        self.statics = {}
+        #Overlays wait for the next frame, as a shown frame can't be drawn on
+        self.overlays = {}
+
+
+    def begin(self):
+        """Draw the background"""
+        self.backdrop.draw()
+
+
+    def draw_layer(self, name, positions, bounds=None):
+        """Draw atlas image name at each position"""
+        draw = self.atlas_texture.draw
+        area = self.areas[name]
+        #A position alone would stretch the area to the whole atlas's size
+        width, height = area.size
+        for x, y in positions:
+            draw(area, (x, y, width, height))
+
+
+    def draw_static(self, key, image, rect):
+        """Draw an image, uploading it again only when it is a new surface"""
+        cached = self.statics.get(key)
+        if cached is None or cached[0] is not image:
+            cached = (image, video.Texture.from_surface(self.renderer, image))
+            self.statics[key] = cached
+        cached[1].draw(None, rect)
+
+
+    def present(self):
+        """Draw waiting overlays and show the frame"""
+        for key, (image, rect) in self.overlays.items():
+            self.draw_static(key, image, rect)
+        self.renderer.present()
+
+
+    def overlay(self, key, image, rect):
+        """Draw image over the next frame, e.g. debug text"""
+        self.overlays[key] = (image, rect)
+
+
+def create_backend(settings, screen, backdrop, atlas, headless=False):
+    """Return the backend settings.render_backend asks for
+
+    "auto" takes SDL's renderer only where it has a GPU renderer, as SDL's
+    software renderer is one more copy than drawing on the display; headless
+    games always draw on their frame buffer then.  A window opened hidden for
+    the renderer is shown again when the software backend is used instead.
+    """
+    name = settings.render_backend
+    if video is not None and (name == "sdl2" or (name == "auto" and not headless)):
+        try:
+            return SDL2Backend(settings, backdrop, atlas, software_fallback=name == "sdl2",
+                fullscreen=settings.fullscreen and not headless)
+        except video.error:
+            if name == "sdl2":
+                raise
+    if name != "software" and not headless:
+        open_window(settings)
+    return SoftwareBackend(settings, screen, backdrop, atlas)
@@ -0,0 +1,89 @@
+import struct
+import pygame
+from headless import ScriptedInput, run_headless
+
+
+#Log header: magic, format version
+HEADER = struct.Struct("<4sB")
+MAGIC = b"AIRC"
+VERSION = 1
+#One record: frame, kind, key index, mouse x, mouse y
+RECORD = struct.Struct("<IBBhh")
+KEY_DOWN, KEY_UP, CLICK, END = range(4)
+#Keys worth recording, stored as their index so a record fits in 10 bytes
+KEYS = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_SPACE, pygame.K_r,
+    pygame.K_p, pygame.K_RETURN)
+KEY_INDEX = {key: index for index, key in enumerate(KEYS)}
+
+
+class InputRecorder:
+    """A class to log per-frame game input to a compact binary file"""
+
+    def __init__(self, path) -> None:
+        """Open the log file and write its header"""
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION))
+        self.last_frame = 0
+
+
+    def record(self, frame, event):
+        """Log event if it is input that affects the simulation"""
+        self.last_frame = frame
+        if event.type == pygame.KEYDOWN and event.key in KEY_INDEX:
+            self.file.write(RECORD.pack(frame, KEY_DOWN, KEY_INDEX[event.key], 0, 0))
+        elif event.type == pygame.KEYUP and event.key in KEY_INDEX:
+            self.file.write(RECORD.pack(frame, KEY_UP, KEY_INDEX[event.key], 0, 0))
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            x, y = event.pos
+            self.file.write(RECORD.pack(frame, CLICK, 0, x, y))
+
+
+    def close(self, frames=None):
+        """Mark how many frames the session ran and close the log"""
+        if self.file.closed:
+            return
+        end = self.last_frame if frames is None else frames
+        self.file.write(RECORD.pack(end, END, 0, 0, 0))
+        self.file.close()
+
+
+class InputLog(ScriptedInput):
+    """A recorded session, replayable like any other scripted input"""
+
+    def __init__(self) -> None:
+        """Start with an empty log"""
+        super().__init__()
+        self.frames = 0
+
+
+    @classmethod
+    def load(cls, path):
+        """Read a log written by InputRecorder"""
+        log = cls()
+        with open(path, "rb") as file:
+            data = file.read()
+        magic, version = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not an Alien Invasion input log")
+        for frame, kind, key, x, y in RECORD.iter_unpack(data[HEADER.size:]):
+            if kind == KEY_DOWN:
+                log.key_down(frame, KEYS[key])
+            elif kind == KEY_UP:
+                log.key_up(frame, KEYS[key])
+            elif kind == CLICK:
+                log.click(frame, (x, y))
+            log.frames = max(log.frames, frame)
+        return log
+
+
+def replay(ai_game, path, observers=(), fps=None):
+    """Feed a recorded session through a fresh game at a fixed timestep
+
+    Pass fps to watch the replay at that speed instead of as fast as possible.
+    """
+    log = InputLog.load(path)
+    observers = list(observers)
+    if fps:
+        clock = pygame.time.Clock()
+        observers.append(lambda: clock.tick(fps))
+    return run_headless(ai_game, log.frames, log, observers)
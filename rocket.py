@@ -0,0 +1,30 @@
+import pygame
+from pygame.sprite import Sprite
+
+
+class Rocket(Sprite):
+    """A class to manage rockets, which pass through aliens"""
+
+    def __init__(self, ai_game) -> None:
+        """Create a rocket object at the ship's position"""
+        super().__init__()
+        self.settings = ai_game.settings
+        self.ship = ai_game.ship
+        #Create a rocket rect at (0, 0) and then set correct position
+        self.rect = pygame.Rect(0, 0, self.settings.rocket_width, self.settings.rocket_height)
+        self.reset()
+
+
+    def reset(self):
+        """Move the rocket back to the ship so it can be fired again"""
+        self.rect.midtop = self.ship.rect.midtop
+        #Store rocket's position as a float
+        self.y = float(self.rect.y)
+        self.prev_y = self.y
+
+
+    def update(self):
+        """Move the rocket up the screen"""
+        self.prev_y = self.y
+        self.y -= self.settings.rocket_speed * self.settings.tick_scale
+        self.rect.y = self.y
\ No newline at end of file
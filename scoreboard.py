@@ -1,6 +1,6 @@
 import pygame.font
-from pygame.sprite import Group
-from ship import Ship
+from assets import load_image
+from glyphs import NumberRenderer
 
 class Scoreboard:
     """A class to report scores"""
@@ -15,33 +15,63 @@ class Scoreboard:
         #Font settings ffor score
         self.text_color = (30, 30, 30)
         self.font = pygame.font.SysFont(None, 48)
+        self.numbers = NumberRenderer(self.font, self.text_color, self.settings.bg_color)
+        #Ships left are drawn with the shared ship image
+        self.ship_image = load_image(self.settings.ship_image)
         #Prepare initial score images
         self.prep_score()
         self.prep_high_score()
+        #The level is placed under the score, so the score is needed first
+        self._render_score()
         self.prep_level()
         self.prep_ships()
 
 
     def prep_score(self):
+        """Mark the score image stale so it is rebuilt once before drawing"""
+        self.score_stale = True
+        self.hud_stale = True
+
+    
+    def prep_high_score(self):
+        """Mark the high score image stale so it is rebuilt once before drawing"""
+        self.high_score_stale = True
+        self.hud_stale = True
+
+
+    def refresh(self):
+        """Rebuild stale images and the HUD, once however many changes this frame"""
+        if not self.hud_stale:
+            return
+        if self.score_stale:
+            self._render_score()
+        if self.high_score_stale:
+            self._render_high_score()
+        self._compose_hud()
+
+
+    def _render_score(self):
         """Turn score into rendered image"""
         rounded_score = round(self.stats.score, -1)
         score_str = f"{rounded_score:,}"
-        self.score_image = self.font.render(score_str, True, self.text_color, self.settings.bg_color)
+        self.score_image = self.numbers.render(score_str)
         #Display score at top right of screen
         self.score_rect = self.score_image.get_rect()
         self.score_rect.right = self.screen_rect.right - 20
         self.score_rect.top = 20
+        self.score_stale = False
 
-    
-    def prep_high_score(self):
+
+    def _render_high_score(self):
         """Turn the high score into a rendered image"""
         high_score = round(self.stats.high_score, -1)
         high_score_str = f"{high_score:,}"
-        self.high_score_image = self.font.render(high_score_str, True, self.text_color, self.settings.bg_color)
+        self.high_score_image = self.numbers.render(high_score_str)
         #Center the high score at top of screen
         self.high_score_rect = self.high_score_image.get_rect()
         self.high_score_rect.centerx = self.screen_rect.centerx
         self.high_score_rect.top = self.score_rect.top
+        self.high_score_stale = False
 
 
     def check_high_score(self):
@@ -54,26 +84,40 @@ class Scoreboard:
     def prep_level(self):
         """Turn the level into a rendered image"""
         level_str = str(self.stats.level)
-        self.level_image = self.font.render(level_str, True, self.text_color, self.settings.bg_color)
+        self.level_image = self.numbers.render(level_str)
         #Position level below the score
         self.level_rect = self.level_image.get_rect()
         self.level_rect.right = self.score_rect.right
         self.level_rect.top = self.score_rect.bottom + 10
+        self.hud_stale = True
 
 
     def prep_ships(self):
-        """Show how many ships are left"""
-        self.ships = Group()
-        for ship_number in range(self.stats.ships_left):
-            ship = Ship(self.ai_game)
-            ship.rect.x = 10 + ship_number * ship.rect.width
-            ship.rect.y = 10
-            self.ships.add(ship)
-
-
-    def show_score(self):
-        """Draw scores, level, and ships to screen"""
-        self.screen.blit(self.score_image, self.score_rect)
-        self.screen.blit(self.high_score_image, self.high_score_rect)
-        self.screen.blit(self.level_image, self.level_rect)
-        self.ships.draw(self.screen)   
\ No newline at end of file
+        """Mark the ships left stale so the HUD is rebuilt once before drawing"""
+        self.hud_stale = True
+
+
+    def _compose_hud(self):
+        """Draw score, high score, level and ships left onto one HUD surface"""
+        ship_width, ship_height = self.ship_image.get_size()
+        height = max(self.level_rect.bottom, 10 + ship_height)
+        #Transparent between the pieces, so the game still shows through
+        hud = pygame.Surface((self.screen_rect.width, height), pygame.SRCALPHA)
+        pieces = [(self.score_image, self.score_rect),
+            (self.high_score_image, self.high_score_rect),
+            (self.level_image, self.level_rect)]
+        pieces += [(self.ship_image, (10 + ship_number * ship_width, 10))
+            for ship_number in range(self.stats.ships_left)]
+        hud.blits(pieces, doreturn=False)
+        #Run length encode it so drawing skips the transparent gaps
+        hud.set_alpha(255, pygame.RLEACCEL)
+        #A new surface each time, so renderers see that the HUD changed
+        self.hud_image = hud
+        self.hud_rect = hud.get_rect()
+        self.hud_stale = False
+
+
+    def images(self):
+        """Return (key, image, rect) for everything the scoreboard draws"""
+        self.refresh()
+        return [("hud", self.hud_image, self.hud_rect)]
\ No newline at end of file
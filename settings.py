@@ -1,45 +1,235 @@
+from presets import PRESETS
+from config import load_settings_file
+from formation import FORMATIONS
+
+#Settings that change with the level, and the speeds among them
+LEVEL_SETTINGS = ("ship_speed", "bullet_speed", "rocket_speed", "alien_speed",
+    "alien_points", "bullets_allowed", "fleet_rows", "fleet_columns")
+SPEED_SETTINGS = ("ship_speed", "bullet_speed", "rocket_speed", "alien_speed")
+#Settings that must be above zero, and counts that may also be zero
+POSITIVE_SETTINGS = ("screen_width", "screen_height", "simulation_rate", "max_fps",
+    "max_catch_up_ticks", "checkpoint_ticks", "bullet_width", "bullet_height",
+    "rocket_width", "rocket_height", "fleet_rows", "fleet_columns", "speed_up_scale",
+    "score_scale", "difficulty_levels") + SPEED_SETTINGS
+COUNT_SETTINGS = ("ship_limit", "respawn_pause_ticks", "level_pause_ticks", "bullets_allowed",
+    "rockets_allowed", "fleet_drop_speed", "alien_points")
+#Settings with a fixed set of values
+CHOICES = {"fleet_formation": tuple(FORMATIONS), "render_backend": ("auto", "software", "sdl2")}
+#Types of the settings whose default is None, which turns them off
+OPTIONAL_TYPES = {"background_image": str, "fleet_rows": int, "fleet_columns": int}
+
+
 class Settings:
     """A class to store all Alien Invasion settings"""
 
-    def __init__(self) -> None:
-        """Initialize STATIC game settings"""
+    def __init__(self, preset="space", path=None) -> None:
+        """Initialize STATIC game settings, then the preset's and settings file's changes"""
+        self.preset = preset
+        self.path = path
         #Screen settings
         self.screen_width = 1200
         self.screen_height = 800
         self.bg_color = (230, 230, 230)
-        
+        #Window mode; full screen takes its size from the display
+        self.fullscreen = False
+        self.caption = "Alien Invasion"
+        #Only redraw and push the parts of the screen that changed
+        self.dirty_rendering = True
+        #How frames are drawn: "software" blits surfaces, "sdl2" uses SDL's
+        #renderer and textures, "auto" takes SDL's only where it has a GPU.
+        #Read at start up only
+        self.render_backend = "auto"
+        #Simulation ticks per second.  Speeds and pauses are tuned for 60
+        #and scaled to whatever rate is set here
+        self.simulation_rate = 60
+        #Most frames drawn per second; frames between ticks are interpolated
+        self.max_fps = 144
+        #Most ticks run in one frame before a slow host drops time instead
+        self.max_catch_up_ticks = 5
+
+        #Art, relative to the engine folder.  No background image means none is drawn
+        self.ship_image = "ship.bmp"
+        self.alien_image = "alien.bmp"
+        self.background_image = None
+        #Play button color, and whether P or Enter also start a game
+        self.button_color = (0, 135, 0)
+        self.keyboard_start = True
+        #Leaderboard file, relative to the engine folder
+        self.scores_file = "highest_score.json"
+
+        #Sound settings: effects are (file, channel category) by name
+        self.sound_enabled = True
+        self.sound_dir = "."
+        self.sound_effects = {
+            "bullet": ("505235__daleonfire__laser2.wav", "shot"),
+            "alien": ("514133__juverisetila__medium-explosion.mp3", "explosion"),
+        }
+        self.music = "721472__victor_natas__boss-fight.wav"
+
         #Ship settings
         self.ship_limit = 3
+        self.ship_speed = 1.5
+        #Pauses in simulation ticks (60 per second) after losing a ship or a level
+        self.respawn_pause_ticks = 30
+        self.level_pause_ticks = 0
+        #How often a game in progress checkpoints its score, in ticks
+        self.checkpoint_ticks = 600
+        #Collect garbage between levels instead of during play, freezing
+        #everything loaded at start up.  Read at start up only
+        self.gc_between_levels = False
 
         #Bullet settings
         self.bullet_width = 3
         self.bullet_height = 15
         self.bullet_color = (60, 60, 60)
         self.bullets_allowed = 3
+        self.bullet_speed = 3.0
+
+        #Rocket settings; rockets pass through aliens and fire with R
+        self.rockets_enabled = False
+        self.rocket_width = 30
+        self.rocket_height = 20
+        self.rocket_color = (200, 200, 200)
+        self.rockets_allowed = 1
+        self.rocket_speed = 10.0
 
         #Alien settings
         self.fleet_drop_speed = 10
+        #Fleet shape: grid, checker, wedge or diamond
+        self.fleet_formation = "grid"
+        #Most rows and columns of aliens; None fills the screen
+        self.fleet_rows = None
+        self.fleet_columns = None
+        self.alien_speed = 1.0
+        #Scoring settings
+        self.alien_points = 50
 
-        #How quickly game speeds up
+        #Level one values above are for ship, bullet, rocket and alien speed,
+        #alien points, bullets allowed and fleet rows and columns.  By default
+        #speeds grow by speed_up_scale and points by score_scale each level
         self.speed_up_scale = 1.1
-        #How quickly alien point values increase
         self.score_scale = 1.5
+        #Per level values replacing that growth, e.g. {"alien_speed": [1.0, 1.5]};
+        #the last value carries on for later levels
+        self.level_curves = {}
+        #Levels worked out ahead of time; later levels play like the last one
+        self.difficulty_levels = 100
+
+        self.defaults = dict(vars(self))
+        self._apply(PRESETS[preset], f"preset {preset!r}")
+        if path is not None:
+            self._apply(load_settings_file(path), str(path))
+        self._build_level_table()
         self.initialize_dynamic_settings()
 
+
+    def _apply(self, changes, source):
+        """Check changes against the default settings, then make them"""
+        for name, value in changes.items():
+            if name not in self.defaults or name in ("preset", "path"):
+                raise ValueError(f"{source}: unknown setting {name!r}")
+            setattr(self, name, _checked(name, value, self.defaults[name], source))
+        for name, curve in self.level_curves.items():
+            if name not in LEVEL_SETTINGS:
+                raise ValueError(f"{source}: {name!r} does not change with the level")
+            if not isinstance(curve, (list, tuple)) or not curve:
+                raise ValueError(f"{source}: the {name!r} curve needs at least one value")
+            self.level_curves[name] = [_checked(name, value, self.defaults[name], source)
+                for value in curve]
+
+
+    def _build_level_table(self):
+        """Work out every level's values so a level up is one lookup"""
+        row = {name: getattr(self, name) for name in LEVEL_SETTINGS}
+        self.level_table = []
+        for level in range(self.difficulty_levels):
+            for name, curve in self.level_curves.items():
+                row[name] = curve[min(level, len(curve) - 1)]
+            self.level_table.append(dict(row))
+            for name in SPEED_SETTINGS:
+                row[name] *= self.speed_up_scale
+            row["alien_points"] = int(row["alien_points"] * self.score_scale)
+
+
     def initialize_dynamic_settings(self):
         """Initialize settings that change throughout the game"""
-        self.ship_speed = 1.5
-        self.bullet_speed = 3.0
-        self.alien_speed = 1.0
+        self.apply_level(1)
         #fleet direction of 1 for right, -1 for left
         self.fleet_direction = 1
-        #Scoring settings
-        self.alien_points = 50
-        
-
-    def increase_speed(self):
-        """Increase speed settings and alien point values"""
-        self.ship_speed *= self.speed_up_scale
-        self.bullet_speed *= self.speed_up_scale
-        self.alien_speed *= self.speed_up_scale
-        self.alien_points = int(self.alien_points * self.score_scale)
\ No newline at end of file
+
+
+    def apply_level(self, level):
+        """Use the speeds, points and fleet size worked out for level"""
+        self.level = level
+        row = self.level_table[min(level, len(self.level_table)) - 1]
+        for name, value in row.items():
+            setattr(self, name, value)
+
+
+    def reload(self):
+        """Read the settings file again, keeping the level and fleet direction
+
+        The window size stays as measured at start up; art, sound and colors
+        are only loaded at start up, so changes to them wait for a restart.
+        """
+        fresh = Settings(self.preset, self.path)
+        fresh.screen_width = self.screen_width
+        fresh.screen_height = self.screen_height
+        fresh.apply_level(self.level)
+        fresh.fleet_direction = self.fleet_direction
+        self.__dict__.update(vars(fresh))
+
+
+    @property
+    def tick_scale(self):
+        """How many 60 per second ticks one simulation tick stands for"""
+        return 60 / self.simulation_rate
+
+
+    def scaled_ticks(self, ticks):
+        """Convert a count of 60 per second ticks to simulation ticks"""
+        return max(1, round(ticks / self.tick_scale))
+
+
+def _checked(name, value, default, source):
+    """Return value if it suits a setting whose default is default"""
+    if default is None:
+        #Optional settings, such as images and fleet limits
+        valid = value is None or (isinstance(value, OPTIONAL_TYPES[name])
+            and not isinstance(value, bool))
+    elif isinstance(default, bool) or isinstance(value, bool):
+        valid = isinstance(value, bool) and isinstance(default, bool)
+    elif isinstance(default, float):
+        valid = isinstance(value, (int, float))
+        value = float(value) if valid else value
+    elif isinstance(default, tuple):
+        #Colors; JSON and TOML give lists
+        valid = (isinstance(value, (list, tuple)) and len(value) == len(default)
+            and all(isinstance(part, int) and 0 <= part <= 255 for part in value))
+        value = tuple(value) if valid else value
+    elif isinstance(default, dict):
+        valid = isinstance(value, dict)
+        if valid and name == "sound_effects":
+            #Each effect is a file and a channel category
+            valid = all(isinstance(sound, (list, tuple)) and len(sound) == 2
+                and all(isinstance(part, str) for part in sound) for sound in value.values())
+            value = {effect: tuple(sound) for effect, sound in value.items()} if valid else value
+        elif valid:
+            #A copy, so checking it never changes a cached settings file
+            value = dict(value)
+    else:
+        valid = isinstance(value, type(default))
+    if not valid and default is None:
+        raise ValueError(f"{source}: {name!r} should be a {OPTIONAL_TYPES[name].__name__}"
+            f" or nothing, not {value!r}")
+    if not valid:
+        raise ValueError(f"{source}: {name!r} should be like {default!r}, not {value!r}")
+    if value is None:
+        return value
+    if name in POSITIVE_SETTINGS and value <= 0:
+        raise ValueError(f"{source}: {name!r} should be above zero, not {value!r}")
+    if name in COUNT_SETTINGS and value < 0:
+        raise ValueError(f"{source}: {name!r} should not be below zero, not {value!r}")
+    if name in CHOICES and value not in CHOICES[name]:
+        raise ValueError(f"{source}: {name!r} should be one of {CHOICES[name]}, not {value!r}")
+    return value
\ No newline at end of file
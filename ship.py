@@ -1,5 +1,6 @@
-import pygame
 from pygame.sprite import Sprite
+from assets import load_image
+from timestep import pixel
 
 class Ship(Sprite):
     """A class to manage the ship"""
@@ -10,13 +11,15 @@ class Ship(Sprite):
         self.screen = ai_game.screen
         self.settings = ai_game.settings
         self.screen_rect = ai_game.screen.get_rect()
-        #Load the ship image and get its rect
-        self.image = pygame.image.load('ship.bmp')
+        #Use the shared ship image and get its rect
+        self.image = load_image(self.settings.ship_image)
         self.rect = self.image.get_rect()
         #Start each new ship at bottom center
         self.rect.midbottom = self.screen_rect.midbottom
         #Store a float for the ships exact horizontal position
         self.x = float(self.rect.x)
+        #Where the ship was a tick ago, for drawing between ticks
+        self.prev_x = self.x
         #Movement flags.  Start with ship that's not moving
         self.moving_right = False
         self.moving_left = False
@@ -24,11 +27,13 @@ class Ship(Sprite):
 
     def update(self):
         """Update ships position based on movement flag"""
+        self.prev_x = self.x
+        speed = self.settings.ship_speed * self.settings.tick_scale
         #Update ships x value, not rect
         if self.moving_right and self.rect.right < self.screen_rect.right:
-            self.x += self.settings.ship_speed
+            self.x += speed
         if self.moving_left and self.rect.left > 0:
-            self.x -= self.settings.ship_speed
+            self.x -= speed
         #Update rect object from self.x
         self.rect.x = self.x
     
@@ -37,8 +42,11 @@ class Ship(Sprite):
         """Center ship on screen"""
         self.rect.midbottom = self.screen_rect.midbottom
         self.x = float(self.rect.x)
+        self.prev_x = self.x
 
 
-    def blitme(self):
-        """Draw the ship"""
-        self.screen.blit(self.image, self.rect)
\ No newline at end of file
+    def position(self, alpha=1.0):
+        """Return where to draw the ship, alpha of the way from its last tick"""
+        if alpha >= 1.0:
+            return self.rect.topleft
+        return (pixel(self.prev_x + (self.x - self.prev_x) * alpha), self.rect.y)
\ No newline at end of file
@@ -1,9 +0,0 @@
-import pygame
-
-
-pygame.mixer.init()
-
-bullet_sound = pygame.mixer.Sound("/home/fireman9143/MyCode/505235__daleonfire__laser2.wav")
-alien_sound = pygame.mixer.Sound("/home/fireman9143/MyCode/514133__juverisetila__medium-explosion.mp3")
-
-#game_music = pygame.mixer.Sound("/home/fireman9143/MyCode/721472__victor_natas__boss-fight.wav")
\ No newline at end of file
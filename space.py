@@ -1,73 +1,235 @@
 import sys
-from time import sleep
+import argparse
 from pathlib import Path
-import json
 import pygame
 from settings import Settings
+from config import FileWatcher
+from presets import PRESETS
 from game_stats import GameStats
+from high_scores import HighScoreStore
 from ship import Ship
 from bullet import Bullet
-from alien import Alien
+from rocket import Rocket
+from pool import ProjectilePool
+from fleet import AlienFleet
+from formation import layout
+from assets import load_image
+from atlas import Atlas
+from background import Background
 from button import Button
 from scoreboard import Scoreboard
-import soundFX as se
+from audio import SoundEngine, NullSoundEngine
+from headless import use_dummy_drivers
+from game_state import GameState
+from render import create_backend
+from timestep import FixedTimestep
+from memory import GCPolicy
+from window import open_window
 
 
-class AlienInvasion:
-    """Overall class to manage game assets and behavior"""
+#Folder the engine lives in; settings give asset paths relative to it
+ROOT = Path(__file__).resolve().parent
+
 
-    def __init__(self) -> None:
-        """InitialDrawize the game and create game resources"""
-        pygame.init()
+class AlienInvasion:
+    """Overall class to manage game assets and behavior
+
+    One engine runs every variant of the game.  The preset names the settings
+    to start from, and those settings switch the optional features (rockets,
+    a background image, sound, full screen) on or off.
+    """
+
+    def __init__(self, headless=False, player="default", scores_path=None, preset="space",
+            settings_path=None, save_scores=True) -> None:
+        """Initialize the game and create game resources"""
+        #Headless games use SDL's dummy drivers and never render or wait
+        self.headless = headless
+        if headless:
+            use_dummy_drivers()
+        #Start only what the first frame needs; sound starts after it shows
+        pygame.display.init()
+        pygame.font.init()
         self.clock = pygame.time.Clock()
-        self.settings = Settings()
-        #For full screen mode, these 3 lines instead of the self.screen below
-        #self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-        #self.settings.screen_width = self.screen.get_rect().width
-        #self.settings.screen_height = self.screen.get_rect().height
-        self.screen = pygame.display.set_mode((self.settings.screen_width, self.settings.screen_height))
-        pygame.display.set_caption("Alien Invasion")
+        self.settings = Settings(preset, settings_path)
+        #Changes to a settings file are picked up while the game runs
+        self.settings_watcher = FileWatcher(settings_path) if settings_path else None
+        #Windows for SDL's renderer open hidden until it is known to start
+        self.screen, self.frame_buffer = open_window(self.settings, headless,
+            hidden=not headless and self.settings.render_backend != "software")
+        #Headless runs keep their scores in memory unless given a file;
+        #games that don't save scores, like replays, never touch one
+        if not save_scores:
+            scores_path = None
+        elif scores_path is None and not headless:
+            scores_path = ROOT / self.settings.scores_file
+        self.high_scores = HighScoreStore(scores_path)
+        self.player = player
         #Create instance to store game stats and create scoreboard
         self.stats = GameStats(self)
         self.sb = Scoreboard(self)
+        #Optional background image
+        self.background = Background(self) if self.settings.background_image else None
         self.ship = Ship(self)
-        self.bullets = pygame.sprite.Group()
-        self.aliens = pygame.sprite.Group()
+        self.bullets = ProjectilePool(self, Bullet, self.settings.bullets_allowed)
+        #Optional rockets
+        self.rockets = None
+        if self.settings.rockets_enabled:
+            self.rockets = ProjectilePool(self, Rocket, self.settings.rockets_allowed)
+        self.aliens = AlienFleet(self, load_image(self.settings.alien_image))
         self._create_fleet()
-        #Set the background color
-        self.bg_color = (230, 230, 230)
+        #Every sprite image packed together, so each layer is one blits() call
+        self.atlas = Atlas()
+        self.atlas.add("ship", self.ship.image)
+        self.atlas.add("alien", self.aliens.image)
+        self.atlas.add_shape("bullet", (self.settings.bullet_width, self.settings.bullet_height),
+            self.settings.bullet_color)
+        if self.rockets is not None:
+            self.atlas.add_shape("rocket", (self.settings.rocket_width, self.settings.rocket_height),
+                self.settings.rocket_color)
+        self.atlas.pack()
         #Start game in inactive state
-        self.game_active = False
+        self.state = GameState.GAME_OVER
+        self.pause_ticks = 0
         #Make the play button
         self.play_button = Button(self, "Play")
-        pygame.mixer.music.load("/home/fireman9143/MyCode/721472__victor_natas__boss-fight.wav")
-        pygame.mixer.music.play(-1)
+        #Background drawn first each frame, and erased back to by dirty rendering
+        backdrop = pygame.Surface(self.screen.get_size()).convert()
+        backdrop.fill(self.settings.bg_color)
+        if self.background is not None:
+            backdrop.blit(self.background.image, self.background.rect)
+        self.backend = create_backend(self.settings, self.screen, backdrop, self.atlas, headless)
+        self._load_sounds()
+        #Work that can wait until the first frame is on screen, one per frame
+        self.startup_tasks = [lambda: self.sounds.play_music(self.settings.music)]
+        self.startup_tasks += [lambda name=name: self.sounds.preload(name)
+            for name in self.settings.sound_effects]
+        #Optionally keep garbage collection pauses out of play
+        self.gc_policy = None
+        if self.settings.gc_between_levels:
+            self.gc_policy = GCPolicy()
+            #Last start up task, so the preloaded sounds are frozen too
+            self.startup_tasks.append(self.gc_policy.start)
+        #Rendering observes the simulation after each step
+        self.observers = [] if headless else [self._update_screen]
+        #Simulation ticks so far, and an optional input recorder
+        self.frames = 0
+        self.recorder = None
+        #How far between the last tick and the next one a frame is drawn
+        self.alpha = 1.0
+
+
+    def _load_sounds(self):
+        """Register sound effects; nothing is decoded yet"""
+        if self.headless or not self.settings.sound_enabled:
+            self.sounds = NullSoundEngine()
+        else:
+            self.sounds = SoundEngine(ROOT / self.settings.sound_dir)
+        for name, (path, category) in self.settings.sound_effects.items():
+            self.sounds.register(name, path, category)
 
 
     def run_game(self):
         "Start main game loop"
+        #Windowed games tick at the simulation rate whatever the frame rate;
+        #headless games run one tick per loop as fast as they can
+        pace = (self.settings.simulation_rate, self.settings.max_catch_up_ticks)
+        timestep = FixedTimestep(*pace)
         while True:
             self._check_events()
-            if self.game_active:
-                self.ship.update()
-                self._update_bullets()
-                self._update_aliens()
-            self._update_screen()
-            self.clock.tick(60)
+            if self.headless:
+                self.step()
+            else:
+                for _ in range(timestep.ticks()):
+                    self.step()
+                self.alpha = timestep.alpha
+            for observer in self.observers:
+                observer()
+            if self.startup_tasks:
+                self.startup_tasks.pop(0)()
+            if self.settings_watcher is not None and self.settings_watcher.changed():
+                self._reload_settings()
+                #A reloaded tick rate or catch-up limit needs a new timestep
+                if (self.settings.simulation_rate, self.settings.max_catch_up_ticks) != pace:
+                    pace = (self.settings.simulation_rate, self.settings.max_catch_up_ticks)
+                    timestep = FixedTimestep(*pace)
+            if not self.headless:
+                self.clock.tick(self.settings.max_fps)
+
+
+    def _reload_settings(self):
+        """Apply an edited settings file without restarting"""
+        try:
+            self.settings.reload()
+        except (OSError, ValueError) as error:
+            #Keep the last good settings while the file is mid-edit
+            print(f"Settings not reloaded: {error}", file=sys.stderr)
+
+
+    @property
+    def game_active(self):
+        """True while a game is in progress, pauses included"""
+        return self.state is not GameState.GAME_OVER
+
+
+    def step(self):
+        """Advance the simulation by one fixed tick"""
+        if self.state is GameState.PLAYING:
+            self.ship.update()
+            if self.rockets is not None:
+                self._update_rockets()
+            self._update_bullets()
+            self._update_aliens()
+            #Checkpoint the score so a crash never loses a record
+            if self.frames % self.settings.scaled_ticks(self.settings.checkpoint_ticks) == 0:
+                self.stats.save_score()
+        else:
+            self._hold_still()
+            if self.state is not GameState.GAME_OVER:
+                #Count down a pause without blocking the loop
+                self.pause_ticks -= 1
+                if self.pause_ticks <= 0:
+                    self.state = GameState.PLAYING
+        self.sounds.new_frame()
+        self.frames += 1
+
+
+    def _hold_still(self):
+        """Forget the last tick's movement, so nothing moves when drawn between ticks"""
+        self.ship.prev_x = self.ship.x
+        self.bullets.hold()
+        if self.rockets is not None:
+            self.rockets.hold()
+        self.aliens.last_step = 0.0
+
+
+    def _pause(self, state, ticks):
+        """Hold the simulation in a pause state for ticks steps"""
+        if ticks > 0:
+            self.state = state
+            self.pause_ticks = self.settings.scaled_ticks(ticks)
+        else:
+            self.state = GameState.PLAYING
 
 
     def _check_events(self):
         """Responds to keyboard and mouse events"""
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self._close_game()
-            elif event.type == pygame.KEYDOWN:
-                self._check_keydown_events(event)
-            elif event.type == pygame.KEYUP:
-                self._check_keyup_events(event)
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                mouse_pos = pygame.mouse.get_pos()
-                self._check_play_button(mouse_pos)
+            if self.recorder is not None:
+                self.recorder.record(self.frames, event)
+            self._handle_event(event)
+
+
+    def _handle_event(self, event):
+        """Respond to a single live or scripted event"""
+        #SDL's renderer window is not the only window, so closing it is no QUIT
+        if event.type in (pygame.QUIT, pygame.WINDOWCLOSE):
+            self._close_game()
+        elif event.type == pygame.KEYDOWN:
+            self._check_keydown_events(event)
+        elif event.type == pygame.KEYUP:
+            self._check_keyup_events(event)
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            self._check_play_button(event.pos)
 
 
     def _check_play_button(self, mouse_pos):
@@ -81,29 +243,31 @@ class AlienInvasion:
 
 
     def _start_game(self):
+        """Reset stats, aliens and the ship for a new game"""
         #Reset game stats
         self.stats.reset_stats()
         self.sb.prep_score()
         self.sb.prep_level()
         self.sb.prep_ships()
-        self.game_active = True
+        self.state = GameState.PLAYING
         #Get rid of bullets and aliens
-        self.bullets.empty()
+        self._empty_projectiles()
         self.aliens.empty()
         #Create new fleet and center ship
         self._create_fleet()
         self.ship.center_ship()
+        self._collect_garbage()
         #Hide mouse cursor
         pygame.mouse.set_visible(False)
 
 
     def _close_game(self):
         """Save high score and exit"""
-        saved_high_score = self.stats.save_high_score()
-        if self.stats.high_score > saved_high_score:
-            path = Path("highest_score.json")
-            contents = json.dumps(self.stats.high_score)
-            path.write_text(contents)
+        if self.recorder is not None:
+            self.recorder.close(self.frames)
+        if self.game_active:
+            self.stats.save_score()
+        self.high_scores.close()
         sys.exit()
 
 
@@ -113,12 +277,14 @@ class AlienInvasion:
             self.ship.moving_right = True
         elif event.key == pygame.K_LEFT:
             self.ship.moving_left =  True
-        elif event.key ==  pygame.K_p or event.key == pygame.K_RETURN:
+        elif event.key in (pygame.K_p, pygame.K_RETURN) and self.settings.keyboard_start:
             self._start_game()
         elif event.key == pygame.K_q:
             self._close_game()
         elif event.key == pygame.K_SPACE:
             self._fire_bullet()
+        elif event.key == pygame.K_r:
+            self._fire_rocket()
 
 
     def _check_keyup_events(self, event):
@@ -130,67 +296,81 @@ class AlienInvasion:
 
 
     def _fire_bullet(self):
-        """Create new bullet and add to bullets group"""
+        """Fire a recycled bullet from the bullet pool"""
         if len(self.bullets) < self.settings.bullets_allowed:
-            new_bullet = Bullet(self)
-            self.bullets.add(new_bullet)
-            se.bullet_sound.play()
+            self.bullets.fire()
+            self.sounds.play("bullet")
+
+
+    def _fire_rocket(self):
+        """Fire a recycled rocket from the rocket pool, if this game has rockets"""
+        if self.rockets is not None and len(self.rockets) < self.settings.rockets_allowed:
+            self.rockets.fire()
+            self.sounds.play("rocket")
+
+
+    def _empty_projectiles(self):
+        """Recycle every bullet and rocket in flight"""
+        if self.rockets is not None:
+            self.rockets.empty()
+        self.bullets.empty()
 
 
     def _update_bullets(self):
         """Update position of bullets and get rid of old bullets"""
-        #Update bullet position
+        #Update bullet position and recycle bullets that are off screen
         self.bullets.update()
-        #Get rid of bullets that are off screen
-        for bullet in self.bullets.copy():
-            if bullet.rect.bottom <= 0:
-                self.bullets.remove(bullet)
         self._check_bullet_alien_collision()
 
 
+    def _update_rockets(self):
+        """Update position of rockets and get rid of old rockets"""
+        #Update rocket position and recycle rockets that are off screen
+        self.rockets.update()
+        self._check_rocket_alien_collision()
+
+
     def _check_bullet_alien_collision(self):
         """Respond to bullet-alien collisions"""
         #Remove any bullets and aliens that collide
-        collisions = pygame.sprite.groupcollide(self.bullets, self.aliens, True, True)
+        collisions = self.aliens.collide_group(self.bullets, True, True)
+        self._score_hits(collisions, "alien")
+
+
+    def _check_rocket_alien_collision(self):
+        """Respond to rocket-alien collisions"""
+        #Rockets keep going through the aliens they destroy
+        collisions = self.aliens.collide_group(self.rockets, False, True)
+        self._score_hits(collisions, "rocket_hit")
+
+
+    def _score_hits(self, collisions, sound):
+        """Score destroyed aliens and start the next level if none are left"""
         if collisions:
             for aliens in collisions.values():
                 self.stats.score += self.settings.alien_points * len(aliens)
             self.sb.prep_score()
             self.sb.check_high_score()
-            se.alien_sound.play()
+            self.sounds.play(sound)
         if not self.aliens:
             #Destroy existing bullets and make new fleet
-            self.bullets.empty()
-            self._create_fleet()
-            self.settings.increase_speed()
-            #Increase level
+            self._empty_projectiles()
+            #Increase level, and look up its speeds and fleet
             self.stats.level += 1
+            self.settings.apply_level(self.stats.level)
+            self._create_fleet()
             self.sb.prep_level()
+            self._collect_garbage()
+            self._pause(GameState.LEVEL_TRANSITION, self.settings.level_pause_ticks)
 
 
     def _create_fleet(self):
         """Create fleet of aliens"""
-        #Make an alien and keep adding until no room left
-        #Space between aliens in one alien width and height
-        alien = Alien(self)
-        alien_width, alien_height = alien.rect.size
-        current_x, current_y = alien_width, alien_height
-        while current_y < (self.settings.screen_height - 3*alien_height):
-            while current_x < (self.settings.screen_width - 2*alien_width):
-                self._create_alien(current_x, current_y)
-                current_x += 2*alien_width
-            #Finished a row, reset x and increment y
-            current_x = alien_width
-            current_y += 2*alien_height
-
-
-    def _create_alien(self, x_position, y_position):
-        """Create an alien and place it in the fleet"""
-        new_alien = Alien(self)
-        new_alien.x = x_position
-        new_alien.rect.x = x_position
-        new_alien.rect.y = y_position
-        self.aliens.add(new_alien)
+        #Slot positions are computed once per screen size and formation
+        fleet_layout = layout(self.settings.screen_width, self.settings.screen_height,
+            self.aliens.width, self.aliens.height, self.settings.fleet_formation,
+            self.settings.fleet_rows, self.settings.fleet_columns)
+        self.aliens.build_layout(fleet_layout)
 
 
     def _update_aliens(self):
@@ -198,7 +378,7 @@ class AlienInvasion:
         self._check_fleet_edges()
         self.aliens.update()
         #Look for alien-ship collision
-        if pygame.sprite.spritecollideany(self.ship, self.aliens):
+        if len(self.aliens.collide_rect(self.ship.rect)):
             self._ship_hit()
         #Look for alien hitting bottom of screen
         self._check_aliens_bottom()
@@ -206,65 +386,113 @@ class AlienInvasion:
 
     def _check_aliens_bottom(self):
         """Check if aliens have reached bottom of screen"""
-        for alien in self.aliens.sprites():
-            if alien.rect.bottom >= self.settings.screen_height:
-                #Treat the same as if ship was hit
-                self._ship_hit()
-                break
+        if self.aliens.reached_bottom():
+            #Treat the same as if ship was hit
+            self._ship_hit()
 
 
     def _ship_hit(self):
         """Respond to ship being hit by alien"""
+        self.sounds.play("ship_hit")
         if self.stats.ships_left > 0:
             #Decrement ships_left and update scoreboard
             self.stats.ships_left -= 1
             self.sb.prep_ships()
             #Get rid of remaining bullets and aliens
-            self.bullets.empty()
+            self._empty_projectiles()
             self.aliens.empty()
             #Create new fleet and center ship
             self._create_fleet()
             self.ship.center_ship()
+            self._collect_garbage()
             #Pause
-            sleep(0.5)
+            self._pause(GameState.RESPAWN_PAUSE, self.settings.respawn_pause_ticks)
         else:
-            self.game_active = False
+            self.stats.save_score()
+            self.state = GameState.GAME_OVER
+            self._collect_garbage()
             pygame.mouse.set_visible(True)
 
 
+    def _collect_garbage(self):
+        """Collect garbage while play is paused, if the GC policy is on"""
+        if self.gc_policy is not None:
+            self.gc_policy.between_levels()
+
+
     def _check_fleet_edges(self):
         """Respond if alien reaches edge"""
-        for alien in self.aliens.sprites():
-            if alien.check_edges():
-                self._change_fleet_direction()
-                break
+        if self.aliens.check_edges():
+            self._change_fleet_direction()
 
 
     def _change_fleet_direction(self):
         """Drop entire fleet and change its direction"""
-        for alien in self.aliens.sprites():
-            alien.rect.y += self.settings.fleet_drop_speed
+        self.aliens.drop()
         self.settings.fleet_direction *= -1
 
 
     def _update_screen(self):
-        """Update images and flip new screen"""
-        #Redraw the screen during each pass of the loop
-        self.screen.fill(self.settings.bg_color)
-        for bullet in self.bullets.sprites():
-            bullet.draw_bullet()
-        self.ship.blitme()
-        self.aliens.draw(self.screen)
-        #Draw scoreboard
-        self.sb.show_score()
+        """Draw the frame through the render backend and show it
+
+        Every backend draws in the same order: background, bullets, rockets,
+        ship, aliens, scoreboard, then the play button.
+        """
+        backend = self.backend
+        alpha = self.alpha
+        backend.begin()
+        backend.draw_layer("bullet", self.bullets.positions(alpha))
+        if self.rockets is not None:
+            backend.draw_layer("rocket", self.rockets.positions(alpha))
+        backend.draw_layer("ship", [self.ship.position(alpha)])
+        backend.draw_layer("alien", *self.aliens.positions(alpha))
+        for key, image, rect in self.sb.images():
+            backend.draw_static(key, image, rect)
         #Draw play button if inactive
         if not self.game_active:
-            self.play_button.draw_button()
-        #Make most recent screen drawn visible
-        pygame.display.flip()
+            backend.draw_static("play", self.play_button.image, self.play_button.rect)
+        backend.present()
+
+
+def main(preset="space"):
+    """Parse the command line and run the game, starting from preset"""
+    parser = argparse.ArgumentParser(description="Alien Invasion")
+    parser.add_argument("--preset", choices=sorted(PRESETS), default=preset,
+        help="which variant of the game to play")
+    parser.add_argument("--settings", metavar="FILE",
+        help="JSON or TOML file of setting changes, reloaded when it is saved")
+    parser.add_argument("--player", default="default", help="name to keep leaderboard scores under")
+    parser.add_argument("--record", metavar="FILE", help="log input to FILE")
+    parser.add_argument("--replay", metavar="FILE", help="play back input logged to FILE")
+    parser.add_argument("--profile", metavar="FILE",
+        help="time each frame phase, show the timings and export them to FILE (.csv or .jsonl)")
+    parser.add_argument("--memory", metavar="FILE",
+        help="trace allocations per frame by call site and GC pauses, and report them to FILE")
+    args = parser.parse_args()
+    #Replayed games are not new scores, so they stay off the leaderboard
+    ai = AlienInvasion(player=args.player, preset=args.preset, settings_path=args.settings,
+        save_scores=not args.replay)
+    #Tools only load when asked for, to keep start up fast
+    if args.profile:
+        from profiler import FrameProfiler, ProfilerOverlay
+        profiler = FrameProfiler(export_path=args.profile)
+        profiler.instrument(ai)
+        ai.observers.append(ProfilerOverlay(ai, profiler))
+    if args.memory:
+        from memory import AllocationTracker
+        ai.observers.append(AllocationTracker(export_path=args.memory).frame)
+    if args.record:
+        from replay import InputRecorder
+        ai.recorder = InputRecorder(args.record)
+    elif args.replay:
+        from replay import replay
+        while ai.startup_tasks:
+            ai.startup_tasks.pop(0)()
+        replay(ai, args.replay, ai.observers, fps=60)
+        ai._close_game()
+    ai.run_game()
 
 
 if __name__ == "__main__":
     #Make an instance of the game and run it
-    ai = AlienInvasion()
-    ai.run_game()
\ No newline at end of file
+    main()
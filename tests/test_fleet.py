@@ -0,0 +1,87 @@
+"""Play the engine against the book's one-sprite-per-alien fleet and compare.
+
+The book moves each alien with `rect.x = self.x`, drops it with
+`rect.y += fleet_drop_speed` and turns the fleet when any rect touches an
+edge.  The array fleet must put every live alien on the same pixel on every
+tick, including at later levels where speeds are fractional.
+"""
+import json
+import sys
+from pathlib import Path
+
+import pygame
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from space import AlienInvasion
+from headless import run_headless
+
+
+class BookFleet:
+    """The book's fleet: a float x and a pygame Rect for every alien"""
+
+    def __init__(self, fleet, settings) -> None:
+        """Copy the positions of a newly built fleet"""
+        self.settings = settings
+        self.direction = settings.fleet_direction
+        self.xs = fleet.x.tolist()
+        self.rects = [pygame.Rect(0, 0, fleet.width, fleet.height) for _ in self.xs]
+        for rect, x, y in zip(self.rects, self.xs, fleet.y.tolist()):
+            rect.x = x
+            rect.y = y
+        self.alive = fleet.alive.tolist()
+
+
+    def update(self):
+        """Turn at an edge, then move, as _update_aliens does"""
+        live = [rect for rect, alive in zip(self.rects, self.alive) if alive]
+        if any(rect.right >= self.settings.screen_width or rect.left <= 0 for rect in live):
+            for rect in live:
+                rect.y += self.settings.fleet_drop_speed
+            self.direction *= -1
+        step = self.settings.alien_speed * self.direction * self.settings.tick_scale
+        for index, rect in enumerate(self.rects):
+            self.xs[index] += step
+            rect.x = self.xs[index]
+
+
+def test_fleet_matches_book_past_level_one(tmp_path):
+    path = tmp_path / "settings.json"
+    path.write_text(json.dumps({"bullets_allowed": 30, "fleet_rows": 2}))
+    ai_game = AlienInvasion(headless=True, settings_path=path)
+    fleet = ai_game.aliens
+    ship = ai_game.ship
+
+    book = {}
+    update_aliens = ai_game._update_aliens
+
+    def checked_update_aliens():
+        #A new fleet since last tick starts a new book fleet
+        if book.get("x") is not fleet.x:
+            book["x"] = fleet.x
+            book["fleet"] = BookFleet(fleet, ai_game.settings)
+        book_fleet = book["fleet"]
+        book_fleet.alive = fleet.alive.tolist()
+        book_fleet.update()
+        update_aliens()
+        if book.get("x") is not fleet.x:
+            return
+        positions, bounds = fleet.positions()
+        expected = [rect.topleft for rect, alive in zip(book_fleet.rects, book_fleet.alive)
+            if alive]
+        assert [(int(x), int(y)) for x, y in positions] == expected, \
+            f"level {ai_game.stats.level}, tick {ai_game.frames}"
+        assert book_fleet.direction == ai_game.settings.fleet_direction
+
+    def aim():
+        #Steer under the lowest live alien and keep firing
+        if not fleet.count:
+            return
+        target = fleet.x[fleet.lowest] + fleet.width / 2
+        ship.moving_right = ship.rect.centerx < target - 2
+        ship.moving_left = ship.rect.centerx > target + 2
+        ai_game._fire_bullet()
+
+    ai_game._update_aliens = checked_update_aliens
+    ai_game._start_game()
+    run_headless(ai_game, 6000, observers=[aim])
+    assert ai_game.stats.level >= 3
@@ -0,0 +1,30 @@
+"""Check that closing the high score store never loses the last score.
+
+Scores are written by a background thread; a score recorded while an
+earlier one is still being written must be on disk once close() returns.
+"""
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from high_scores import HighScoreStore
+
+
+def test_close_during_slow_write_keeps_last_score(tmp_path):
+    path = tmp_path / "scores.json"
+    store = HighScoreStore(path)
+    write = store._write
+
+    def slow_write(contents):
+        time.sleep(0.2)
+        write(contents)
+
+    store._write = slow_write
+    store.record("default", "game", 100)
+    time.sleep(0.05)
+    store.record("default", "game", 5000)
+    store.close()
+    assert json.loads(path.read_text()) == {"default": [{"score": 5000, "game": "game"}]}
+    assert HighScoreStore(path).best("default") == 5000
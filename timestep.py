@@ -0,0 +1,44 @@
+from math import copysign, floor
+from time import perf_counter
+
+
+def pixel(position):
+    """Round a position to a whole pixel the way a pygame Rect does, half away from zero"""
+    return int(copysign(floor(abs(position) + 0.5), position))
+
+
+class FixedTimestep:
+    """A class to turn real elapsed time into whole simulation ticks
+
+    The game always advances in ticks of the same length, however fast or
+    slow frames are drawn.  Time left over between ticks is kept so the
+    renderer can draw alpha of the way from the last tick to the current one.
+    """
+
+    def __init__(self, rate, max_catch_up=5) -> None:
+        """Run rate ticks a second, at most max_catch_up of them per frame"""
+        self.step_time = 1 / rate
+        self.max_catch_up = max_catch_up
+        #Start one tick behind so the very first frame moves the game
+        self.lag = self.step_time
+        self.last = perf_counter()
+
+
+    def ticks(self):
+        """Return how many ticks to run for the time since the last call"""
+        now = perf_counter()
+        self.lag += now - self.last
+        self.last = now
+        ticks = int(self.lag / self.step_time)
+        if ticks > self.max_catch_up:
+            #Too far behind to catch up: drop the time rather than spiral
+            self.lag = 0.0
+            return self.max_catch_up
+        self.lag -= ticks * self.step_time
+        return ticks
+
+
+    @property
+    def alpha(self):
+        """How far the next tick has come, from 0 to 1"""
+        return min(self.lag / self.step_time, 1.0)
@@ -0,0 +1,30 @@
+import pygame
+
+
+def open_window(settings, headless=False, hidden=False):
+    """Open the game's display and return (screen, frame_buffer)
+
+    Full screen windows take their size from the display and write it back to
+    settings.  Headless games draw into their own pixel buffer, so several can
+    share a process and the frame can be read without copying it; windowed
+    games have no frame buffer.  A hidden display only sets the size and pixel
+    format, for when an SDL renderer window shows the game instead.
+    """
+    pygame.display.set_caption(settings.caption)
+    if headless:
+        size = (settings.screen_width, settings.screen_height)
+        pygame.display.set_mode(size)
+        frame_buffer = bytearray(size[0] * size[1] * 4)
+        return pygame.image.frombuffer(frame_buffer, size, "BGRA"), frame_buffer
+    if hidden:
+        if settings.fullscreen:
+            settings.screen_width, settings.screen_height = pygame.display.get_desktop_sizes()[0]
+        return pygame.display.set_mode((settings.screen_width, settings.screen_height),
+            pygame.HIDDEN), None
+    if settings.fullscreen:
+        screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        settings.screen_width = screen.get_rect().width
+        settings.screen_height = screen.get_rect().height
+    else:
+        screen = pygame.display.set_mode((settings.screen_width, settings.screen_height))
+    return screen, None
\ No newline at end of file